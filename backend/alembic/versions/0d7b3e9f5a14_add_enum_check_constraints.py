@@ -0,0 +1,35 @@
+"""Add check constraints on enum-backed status and frequency columns
+
+Revision ID: 0d7b3e9f5a14
+Revises: 4f0c8a6d2e71
+Create Date: 2026-10-14 12:31:09.874120
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0d7b3e9f5a14'
+down_revision = '4f0c8a6d2e71'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Values were normalized by b81f3c6a0e29 and 4f0c8a6d2e71
+    for table in ('recurring_income', 'recurring_expenses'):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.create_check_constraint(f'ck_{table}_is_active', "is_active IN ('active', 'paused', 'ended')")
+            batch_op.create_check_constraint(f'ck_{table}_frequency', "frequency IN ('weekly', 'monthly', 'quarterly', 'annually')")
+    with op.batch_alter_table('one_off_items') as batch_op:
+        batch_op.create_check_constraint('ck_one_off_items_is_confirmed', "is_confirmed IN ('planned', 'confirmed', 'completed', 'cancelled')")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('one_off_items') as batch_op:
+        batch_op.drop_constraint('ck_one_off_items_is_confirmed', type_='check')
+    for table in ('recurring_expenses', 'recurring_income'):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_constraint(f'ck_{table}_frequency', type_='check')
+            batch_op.drop_constraint(f'ck_{table}_is_active', type_='check')
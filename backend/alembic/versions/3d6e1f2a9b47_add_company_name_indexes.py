@@ -0,0 +1,29 @@
+"""Add company-scoped name indexes to customers and bank_accounts
+
+Revision ID: 3d6e1f2a9b47
+Revises: 738ce09051d8
+Create Date: 2026-10-14 09:12:31.418203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3d6e1f2a9b47'
+down_revision = '738ce09051d8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # init_database.py may already have created these from the models via create_all
+    op.create_index('ix_customers_company_id_name', 'customers', ['company_id', 'name'], unique=False, if_not_exists=True)
+    op.create_index('ix_bank_accounts_company_id_name', 'bank_accounts', ['company_id', 'name'], unique=False, if_not_exists=True)
+    op.create_index('ix_bank_accounts_company_id_default', 'bank_accounts', ['company_id', 'is_default', 'is_active'], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_bank_accounts_company_id_default', table_name='bank_accounts', if_exists=True)
+    op.drop_index('ix_bank_accounts_company_id_name', table_name='bank_accounts', if_exists=True)
+    op.drop_index('ix_customers_company_id_name', table_name='customers', if_exists=True)
@@ -0,0 +1,32 @@
+"""Constrain recurring frequency columns to enum values
+
+Revision ID: 4f0c8a6d2e71
+Revises: e5a2d9c41f86
+Create Date: 2026-10-14 12:05:41.318227
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4f0c8a6d2e71'
+down_revision = 'e5a2d9c41f86'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Normalize existing values; the projection treated anything unrecognized as a
+    # 30-day cadence, so map it to monthly
+    for table in ('recurring_income', 'recurring_expenses'):
+        op.execute(f"UPDATE {table} SET frequency = lower(trim(frequency))")
+        op.execute(f"UPDATE {table} SET frequency = 'monthly' WHERE frequency NOT IN ('weekly', 'monthly', 'quarterly', 'annually')")
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column('frequency', existing_type=sa.String(), type_=sa.String(length=9), existing_nullable=False)
+
+
+def downgrade() -> None:
+    for table in ('recurring_expenses', 'recurring_income'):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column('frequency', existing_type=sa.String(length=9), type_=sa.String(), existing_nullable=False)
@@ -0,0 +1,31 @@
+"""Index projections by company and date instead of date alone
+
+Revision ID: 6e2a9c5d8b30
+Revises: 0d7b3e9f5a14
+Create Date: 2026-10-14 12:58:46.205318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6e2a9c5d8b30'
+down_revision = '0d7b3e9f5a14'
+branch_labels = None
+depends_on = None
+
+TABLES = ('cash_flow_projections', 'projection_items')
+
+
+def upgrade() -> None:
+    # init_database.py may already have created these from the models via create_all
+    for table in TABLES:
+        op.create_index(f'ix_{table}_company_id_projection_date', table, ['company_id', 'projection_date'], unique=False, if_not_exists=True)
+        op.drop_index(f'ix_{table}_projection_date', table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.create_index(f'ix_{table}_projection_date', table, ['projection_date'], unique=False, if_not_exists=True)
+        op.drop_index(f'ix_{table}_company_id_projection_date', table_name=table, if_exists=True)
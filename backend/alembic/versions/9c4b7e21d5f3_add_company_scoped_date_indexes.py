@@ -0,0 +1,38 @@
+"""Add company-scoped date and status indexes
+
+Revision ID: 9c4b7e21d5f3
+Revises: 3d6e1f2a9b47
+Create Date: 2026-10-14 10:03:52.771940
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c4b7e21d5f3'
+down_revision = '3d6e1f2a9b47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # init_database.py may already have created these from the models via create_all
+    op.create_index('ix_transactions_company_id_transaction_date', 'transactions', ['company_id', 'transaction_date'], unique=False, if_not_exists=True)
+    op.create_index('ix_expenses_company_id_expense_date', 'expenses', ['company_id', 'expense_date'], unique=False, if_not_exists=True)
+    op.create_index('ix_one_off_items_company_id_planned_date', 'one_off_items', ['company_id', 'planned_date'], unique=False, if_not_exists=True)
+    for table in ('recurring_income', 'recurring_expenses'):
+        op.create_index(f'ix_{table}_company_id_is_active', table, ['company_id', 'is_active'], unique=False, if_not_exists=True)
+        op.create_index(
+            f'ix_{table}_active_company_id_start_date', table, ['company_id', 'start_date'],
+            unique=False, if_not_exists=True, postgresql_where=sa.text("is_active = 'active'")
+        )
+
+
+def downgrade() -> None:
+    for table in ('recurring_expenses', 'recurring_income'):
+        op.drop_index(f'ix_{table}_active_company_id_start_date', table_name=table, if_exists=True)
+        op.drop_index(f'ix_{table}_company_id_is_active', table_name=table, if_exists=True)
+    op.drop_index('ix_one_off_items_company_id_planned_date', table_name='one_off_items', if_exists=True)
+    op.drop_index('ix_expenses_company_id_expense_date', table_name='expenses', if_exists=True)
+    op.drop_index('ix_transactions_company_id_transaction_date', table_name='transactions', if_exists=True)
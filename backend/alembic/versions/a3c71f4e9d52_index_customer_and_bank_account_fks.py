@@ -0,0 +1,34 @@
+"""Index customer and bank account foreign keys on transactions and recurring streams
+
+Revision ID: a3c71f4e9d52
+Revises: 6e2a9c5d8b30
+Create Date: 2026-10-14 13:14:27.550931
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3c71f4e9d52'
+down_revision = '6e2a9c5d8b30'
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ('transactions', 'customer_id'),
+    ('recurring_income', 'customer_id'),
+    ('recurring_income', 'bank_account_id'),
+    ('recurring_expenses', 'bank_account_id'),
+)
+
+
+def upgrade() -> None:
+    # init_database.py may already have created these from the models via create_all
+    for table, column in INDEXES:
+        op.create_index(f'ix_{table}_{column}', table, [column], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for table, column in reversed(INDEXES):
+        op.drop_index(f'ix_{table}_{column}', table_name=table, if_exists=True)
@@ -0,0 +1,37 @@
+"""Constrain recurring and one-off status columns to enum values
+
+Revision ID: b81f3c6a0e29
+Revises: 9c4b7e21d5f3
+Create Date: 2026-10-14 10:48:17.205634
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b81f3c6a0e29'
+down_revision = '9c4b7e21d5f3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The projection only ever matched the exact canonical values, so anything else
+    # (NULL, 'Active', ' active', ...) maps to a state the projection still skips
+    for table in ('recurring_income', 'recurring_expenses'):
+        op.execute(f"UPDATE {table} SET is_active = 'paused' WHERE is_active IS NULL OR is_active NOT IN ('active', 'paused', 'ended')")
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column('is_active', existing_type=sa.String(), type_=sa.String(length=6), nullable=False)
+
+    op.execute("UPDATE one_off_items SET is_confirmed = 'cancelled' WHERE is_confirmed IS NULL OR is_confirmed NOT IN ('planned', 'confirmed', 'completed', 'cancelled')")
+    with op.batch_alter_table('one_off_items') as batch_op:
+        batch_op.alter_column('is_confirmed', existing_type=sa.String(), type_=sa.String(length=9), nullable=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('one_off_items') as batch_op:
+        batch_op.alter_column('is_confirmed', existing_type=sa.String(length=9), type_=sa.String(), nullable=True)
+    for table in ('recurring_expenses', 'recurring_income'):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column('is_active', existing_type=sa.String(length=6), type_=sa.String(), nullable=True)
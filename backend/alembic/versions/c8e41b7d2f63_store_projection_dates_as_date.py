@@ -0,0 +1,55 @@
+"""Store projection dates as calendar dates
+
+Revision ID: c8e41b7d2f63
+Revises: a3c71f4e9d52
+Create Date: 2026-10-14 14:02:11.804517
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8e41b7d2f63'
+down_revision = 'a3c71f4e9d52'
+branch_labels = None
+depends_on = None
+
+TABLES = ('cash_flow_projections', 'projection_items')
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        # A batch rebuild copies the column through CAST(... AS DATE), which SQLite turns
+        # into the leading integer (2024). Both column types share NUMERIC affinity there,
+        # so rewrite the stored timestamps as ISO dates in place instead.
+        for table in TABLES:
+            op.execute(f"UPDATE {table} SET projection_date = date(projection_date)")
+        return
+
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                'projection_date',
+                existing_type=sa.DateTime(timezone=True),
+                type_=sa.Date(),
+                existing_nullable=False,
+                postgresql_using='projection_date::date',
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        for table in TABLES:
+            op.execute(f"UPDATE {table} SET projection_date = datetime(projection_date)")
+        return
+
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                'projection_date',
+                existing_type=sa.Date(),
+                type_=sa.DateTime(timezone=True),
+                existing_nullable=False,
+                postgresql_using='projection_date::timestamptz',
+            )
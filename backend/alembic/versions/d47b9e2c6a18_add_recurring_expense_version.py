@@ -0,0 +1,25 @@
+"""Add a row version to recurring expenses
+
+Revision ID: d47b9e2c6a18
+Revises: f2d6a8c3e517
+Create Date: 2026-10-14 15:20:43.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd47b9e2c6a18'
+down_revision = 'f2d6a8c3e517'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('recurring_expenses', sa.Column('version', sa.Integer(), nullable=False, server_default=sa.text('1')))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('recurring_expenses') as batch_op:
+        batch_op.drop_column('version')
@@ -0,0 +1,36 @@
+"""Store transaction, expense and recurring income amounts as integer cents
+
+Revision ID: e5a2d9c41f86
+Revises: b81f3c6a0e29
+Create Date: 2026-10-14 11:37:05.662418
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a2d9c41f86'
+down_revision = 'b81f3c6a0e29'
+branch_labels = None
+depends_on = None
+
+TABLES = ('transactions', 'expenses', 'recurring_income')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(table, sa.Column('amount_cents', sa.BigInteger(), nullable=True))
+        op.execute(f"UPDATE {table} SET amount_cents = CAST(ROUND(amount * 100) AS BIGINT)")
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column('amount_cents', existing_type=sa.BigInteger(), nullable=False)
+            batch_op.drop_column('amount')
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.add_column(table, sa.Column('amount', sa.Numeric(precision=15, scale=2), nullable=True))
+        op.execute(f"UPDATE {table} SET amount = amount_cents / 100.0")
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column('amount', existing_type=sa.Numeric(precision=15, scale=2), nullable=False)
+            batch_op.drop_column('amount_cents')
@@ -0,0 +1,27 @@
+"""Index projections by company, bank account and date
+
+Revision ID: f2d6a8c3e517
+Revises: c8e41b7d2f63
+Create Date: 2026-10-14 14:31:05.217946
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2d6a8c3e517'
+down_revision = 'c8e41b7d2f63'
+branch_labels = None
+depends_on = None
+
+INDEX = 'ix_cash_flow_projections_company_id_bank_account_id_projection_date'
+
+
+def upgrade() -> None:
+    # init_database.py may already have created this from the models via create_all
+    op.create_index(INDEX, 'cash_flow_projections', ['company_id', 'bank_account_id', 'projection_date'], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index(INDEX, table_name='cash_flow_projections', if_exists=True)
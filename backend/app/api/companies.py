@@ -1,6 +1,6 @@
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from app.core.database import get_db
 from app.core.auth import get_current_active_user
 from app.schemas.company import Company, CompanyCreate, CompanyUpdate
@@ -73,7 +73,16 @@ def delete_company(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    company = db.query(CompanyModel).filter(
+    # Deleting a company touches its child collections, so load them up front
+    company = db.query(CompanyModel).options(
+        selectinload(CompanyModel.customers),
+        selectinload(CompanyModel.transactions),
+        selectinload(CompanyModel.expenses),
+        selectinload(CompanyModel.recurring_income),
+        selectinload(CompanyModel.recurring_expenses),
+        selectinload(CompanyModel.one_off_items),
+        selectinload(CompanyModel.projections)
+    ).filter(
         CompanyModel.id == company_id,
         CompanyModel.owner_id == current_user.id
     ).first()
@@ -1,13 +1,14 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Response
+from sqlalchemy.orm import Session, selectinload
 import csv
 import io
 import logging
 from datetime import datetime
 from app.core.database import get_db
 from app.core.auth import get_current_active_user
-from app.schemas.customer import Customer, CustomerCreate, CustomerUpdate
+from app.core.bulk import bulk_insert
+from app.schemas.customer import Customer, CustomerCreate, CustomerUpdate, CustomerList
 from app.models.user import User
 from app.models.customer import Customer as CustomerModel
 from app.models.company import Company as CompanyModel
@@ -112,7 +113,11 @@ def read_customers(
 ):
     verify_company_ownership(db, company_id, current_user.id)
     customers = db.query(CustomerModel).filter(CustomerModel.company_id == company_id).offset(skip).limit(limit).all()
-    return customers
+    # Validate and encode in one pass instead of FastAPI's validate -> dict -> JSON
+    return Response(
+        CustomerList.dump_json(CustomerList.validate_python(customers, from_attributes=True)),
+        media_type="application/json"
+    )
 
 @router.get("/import-template")
 def get_import_template(
@@ -257,7 +262,11 @@ def delete_customer(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    customer = db.query(CustomerModel).filter(CustomerModel.id == customer_id).first()
+    # Load the linked transactions and recurring income so the delete can unlink them
+    customer = db.query(CustomerModel).options(
+        selectinload(CustomerModel.transactions),
+        selectinload(CustomerModel.recurring_income)
+    ).filter(CustomerModel.id == customer_id).first()
     if not customer:
         raise HTTPException(status_code=404, detail="Customer not found")
     
@@ -288,6 +297,7 @@ def import_customers_csv(
         csv_reader = csv.DictReader(io.StringIO(csv_content))
         
         imported_customers = []
+        pending = []
         errors = []
         
         for row_num, row in enumerate(csv_reader, start=2):  # Start at 2 for header row
@@ -317,9 +327,8 @@ def import_customers_csv(
                     errors.append(f"Row {row_num}: Customer name is required")
                     continue
                 
-                # Create customer
-                db_customer = CustomerModel(**customer_data)
-                db.add(db_customer)
+                # Queue customer
+                pending.append(customer_data)
                 imported_customers.append(customer_data['name'])
                 
             except ValueError as e:
@@ -327,8 +336,9 @@ def import_customers_csv(
             except Exception as e:
                 errors.append(f"Row {row_num}: {str(e)}")
         
-        # Commit all successful imports
-        if imported_customers:
+        # Insert all successful rows in one batched statement
+        if pending:
+            bulk_insert(db, CustomerModel, pending)
             db.commit()
         
         return {
@@ -1,10 +1,10 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from datetime import date
 from app.core.database import get_db
 from app.core.auth import get_current_active_user
-from app.schemas.transaction import Transaction, TransactionCreate, TransactionUpdate
+from app.schemas.transaction import Transaction, TransactionCreate, TransactionUpdate, TransactionList
 from app.models.user import User
 from app.models.transaction import Transaction as TransactionModel, TransactionType, TransactionStatus
 from app.models.company import Company as CompanyModel
@@ -59,7 +59,11 @@ def read_transactions(
         query = query.filter(TransactionModel.transaction_date <= end_date)
     
     transactions = query.offset(skip).limit(limit).all()
-    return transactions
+    # Validate and encode in one pass instead of FastAPI's validate -> dict -> JSON
+    return Response(
+        TransactionList.dump_json(TransactionList.validate_python(transactions, from_attributes=True)),
+        media_type="application/json"
+    )
 
 @router.get("/{transaction_id}", response_model=Transaction)
 def read_transaction(
@@ -9,6 +9,7 @@ from app.core.auth import get_current_active_user
 from app.models.user import User
 from app.models.expense import ExpenseCategory
 from app.schemas.expense import ExpenseCategory as ExpenseCategorySchema, ExpenseCategoryCreate, ExpenseCategoryUpdate
+from app.services.expense_category_service import invalidate_category_cache
 
 router = APIRouter()
 
@@ -126,6 +127,7 @@ def import_expense_categories_csv(
         # Commit all successful imports
         if imported_categories:
             db.commit()
+            invalidate_category_cache()
         
         return {
             "success": len(imported_categories),
@@ -206,6 +208,7 @@ def create_expense_category(
     db_category = ExpenseCategory(**category.dict())
     db.add(db_category)
     db.commit()
+    invalidate_category_cache()
     db.refresh(db_category)
     return db_category
 
@@ -242,6 +245,7 @@ def update_expense_category(
         setattr(category, field, value)
     
     db.commit()
+    invalidate_category_cache()
     db.refresh(category)
     return category
 
@@ -268,4 +272,5 @@ def delete_expense_category(
     
     db.delete(category)
     db.commit()
+    invalidate_category_cache()
     return {"detail": "Expense category deleted successfully"}
\ No newline at end of file
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
@@ -6,7 +6,7 @@ from app.core.database import get_db
 from app.core.auth import get_current_active_user
 from app.models.user import User
 from app.models.one_off_item import OneOffItem
-from app.schemas.one_off_item import OneOffItemCreate, OneOffItemUpdate, OneOffItem as OneOffItemSchema
+from app.schemas.one_off_item import OneOffItemCreate, OneOffItemUpdate, OneOffItem as OneOffItemSchema, OneOffItemList
 
 router = APIRouter()
 
@@ -28,7 +28,11 @@ def get_one_off_items_by_company(
         query = query.filter(OneOffItem.is_confirmed == status)
     
     items = query.order_by(OneOffItem.planned_date).all()
-    return items
+    # Validate and encode in one pass instead of FastAPI's validate -> dict -> JSON
+    return Response(
+        OneOffItemList.dump_json(OneOffItemList.validate_python(items, from_attributes=True)),
+        media_type="application/json"
+    )
 
 @router.get("/{item_id}", response_model=OneOffItemSchema)
 def get_one_off_item(
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date, datetime, timedelta
 from decimal import Decimal
+import logging
 
 from app.core.database import get_db
 from app.core.auth import get_current_active_user
@@ -15,6 +16,7 @@ from app.services.projection_service import ProjectionCalculationService
 from app.models.bank_account import BankAccount
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 @router.post("/generate/{company_id}")
 def generate_projections(
@@ -35,9 +37,7 @@ def generate_projections(
         )
         return {"detail": "Projections generated successfully"}
     except Exception as e:
-        import traceback
-        print(f"Error in projection generation: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Error in projection generation for company %s", company_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error generating projections: {str(e)}"
@@ -160,7 +160,7 @@ def get_projection_summary(
         weekly_data = {}
         for projection in projections:
             # Get Monday of the week
-            monday = projection.projection_date.date() - timedelta(days=projection.projection_date.weekday())
+            monday = projection.projection_date - timedelta(days=projection.projection_date.weekday())
             week_key = monday.strftime("%Y-W%U")
             
             if week_key not in weekly_data:
@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Request, Response
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import csv
+import hashlib
 import io
+import re
 from datetime import datetime
-from decimal import Decimal, InvalidOperation
+from decimal import Decimal
 
 from app.core.database import get_db
 from app.core.auth import get_current_active_user
@@ -14,9 +17,15 @@ from app.models.company import Company
 from app.models.expense import ExpenseCategory
 from app.models.bank_account import BankAccount
 from app.schemas.recurring_expense import RecurringExpenseCreate, RecurringExpenseUpdate, RecurringExpense as RecurringExpenseSchema
+from app.services.expense_category_service import get_category_id_by_name
 
 router = APIRouter()
 
+_DECIMAL_RE = re.compile(r'^-?\d+(?:\.\d+)?$')
+
+# Rows are inserted and committed in chunks of this size during CSV import
+CHUNK_SIZE = 5000
+
 @router.get("/import-template")
 def get_import_template(
     current_user: User = Depends(get_current_active_user)
@@ -84,9 +93,18 @@ def get_import_template(
     csv_content = output.getvalue()
     output.close()
     
+    return Response(
+        content=csv_content.encode('utf-8'),
+        media_type='text/csv; charset=utf-8',
+        headers={'Content-Disposition': 'attachment; filename="recurring_expenses_import_template.csv"'}
+    )
+
+@router.get("/import-template/help")
+def get_import_template_help(
+    current_user: User = Depends(get_current_active_user)
+):
+    """Describe the columns of the recurring expense import template"""
     return {
-        "filename": "recurring_expenses_import_template.csv",
-        "content": csv_content,
         "instructions": {
             "name": "Expense name (required)",
             "description": "Description of the recurring expense (optional)",
@@ -107,10 +125,30 @@ def get_import_template(
 @router.get("/company/{company_id}", response_model=List[RecurringExpenseSchema])
 def get_recurring_expenses_by_company(
     company_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get all recurring expense patterns for a company"""
+    # Cheap version check: inserts and deletes move the count and id sum, and every
+    # update bumps a row's version, even within updated_at's one-second resolution
+    version = db.query(
+        func.count(RecurringExpense.id),
+        func.sum(RecurringExpense.id),
+        func.sum(RecurringExpense.version),
+        func.max(RecurringExpense.updated_at)
+    ).filter(RecurringExpense.company_id == company_id).one()
+    # Weak: the tag tracks the stored rows, not the exact bytes served for them
+    etag = 'W/"' + hashlib.md5(repr(tuple(version)).encode()).hexdigest() + '"'
+    
+    # Weak comparison (RFC 9110): an intermediary may have dropped the W/ prefix
+    client_tags = [tag.strip().removeprefix('W/') for tag in request.headers.get('if-none-match', '').split(',')]
+    if etag.removeprefix('W/') in client_tags:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+    
+    response.headers['ETag'] = etag
+    response.headers['Cache-Control'] = 'private, no-cache'
     recurring_expenses = db.query(RecurringExpense).filter(
         RecurringExpense.company_id == company_id
     ).all()
@@ -189,6 +227,9 @@ def update_recurring_expense(
     update_data = expense_update.dict(exclude_unset=True)
     for field, value in update_data.items():
         setattr(db_expense, field, value)
+    if update_data:
+        # Incremented in SQL so concurrent updates each move the list ETag
+        db_expense.version = RecurringExpense.version + 1
     
     db.commit()
     db.refresh(db_expense)
@@ -239,13 +280,15 @@ def parse_date(date_str: str):
     raise ValueError(f"Invalid date format: {date_str}. Expected format: YYYY-MM-DD")
 
 def parse_decimal(value_str: str):
-    """Parse decimal string"""
+    """Parse decimal string (plain notation only, e.g. 1234.56)"""
     if not value_str:
         return Decimal('0.00')
-    try:
-        return Decimal(str(value_str))
-    except (InvalidOperation, ValueError):
+    value_str = value_str.strip()
+    if not value_str:
+        return Decimal('0.00')
+    if not _DECIMAL_RE.match(value_str):
         raise ValueError(f"Invalid decimal value: {value_str}")
+    return Decimal(value_str)
 
 @router.post("/company/{company_id}/import-csv")
 def import_recurring_expense_csv(
@@ -269,18 +312,15 @@ def import_recurring_expense_csv(
         
         imported_items = []
         errors = []
+        batch = []
         
         for row_num, row in enumerate(csv_reader, start=2):  # Start at 2 for header row
             try:
                 # Find expense category if specified
                 category_id = None
                 if row.get('category_name', '').strip():
-                    category = db.query(ExpenseCategory).filter(
-                        ExpenseCategory.name == row['category_name'].strip()
-                    ).first()
-                    if category:
-                        category_id = category.id
-                    else:
+                    category_id = get_category_id_by_name(db, row['category_name'].strip())
+                    if category_id is None:
                         errors.append(f"Row {row_num}: Expense category '{row['category_name']}' not found")
                         continue
                 
@@ -386,18 +426,23 @@ def import_recurring_expense_csv(
                     errors.append(f"Row {row_num}: is_active must be: active, paused, or ended")
                     continue
                 
-                # Create recurring expense
-                db_expense = RecurringExpense(**expense_data)
-                db.add(db_expense)
+                # Queue recurring expense for the next bulk insert
+                batch.append(expense_data)
                 imported_items.append(expense_data['name'])
                 
             except ValueError as e:
                 errors.append(f"Row {row_num}: Invalid data format - {str(e)}")
             except Exception as e:
                 errors.append(f"Row {row_num}: {str(e)}")
+            
+            if len(batch) >= CHUNK_SIZE:
+                db.bulk_insert_mappings(RecurringExpense, batch)
+                db.commit()
+                batch.clear()
         
-        # Commit all successful imports
-        if imported_items:
+        # Insert and commit the final partial chunk
+        if batch:
+            db.bulk_insert_mappings(RecurringExpense, batch)
             db.commit()
         
         return {
@@ -467,8 +512,8 @@ def export_recurring_expense_csv(
     csv_content = output.getvalue()
     output.close()
     
-    return {
-        "filename": f"recurring_expenses_export_{company_id}.csv",
-        "content": csv_content,
-        "count": len(recurring_expenses)
-    }
\ No newline at end of file
+    return Response(
+        content=csv_content.encode('utf-8'),
+        media_type='text/csv; charset=utf-8',
+        headers={'Content-Disposition': f'attachment; filename="recurring_expenses_export_{company_id}.csv"'}
+    )
\ No newline at end of file
@@ -1,34 +1,46 @@
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import csv
 import io
+import logging
+import re
 from datetime import datetime
-from decimal import Decimal, InvalidOperation
 
-from app.core.database import get_db
+from app.core.database import get_db, SessionLocal
 from app.core.auth import get_current_active_user
 from app.models.user import User
 from app.models.recurring_income import RecurringIncome
 from app.models.customer import Customer
 from app.models.company import Company
 from app.models.bank_account import BankAccount
+from app.models.money import to_cents, from_cents
+from app.models.enums import FrequencyType
 from app.schemas.recurring_income import RecurringIncomeCreate, RecurringIncomeUpdate, RecurringIncome as RecurringIncomeSchema
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
-@router.get("/import-template")
-def get_import_template(
-    current_user: User = Depends(get_current_active_user)
-):
-    """Download CSV template for recurring income import"""
+# Fallback formats tried after the ISO fast path; '%Y-%m-%d' still covers unpadded dates like 2024-1-5
+_DATE_FORMATS = ('%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d')
+_DECIMAL_RE = re.compile(r'^-?\d+(?:\.\d+)?$')
+
+_VALID_FREQUENCIES = frozenset(('weekly', 'monthly', 'quarterly', 'annually'))
+_VALID_STATUSES = frozenset(('active', 'paused', 'ended'))
+
+# Column order shared by the import template and the export
+_EXPORT_FIELDS = ('name', 'description', 'amount', 'vat_amount', 'frequency', 'start_date', 'end_date', 'day_of_month', 'day_of_week', 'is_active', 'notes', 'customer_name', 'bank_account_name')
+
+def _build_import_template():
+    """Build the CSV template response for recurring income import"""
     
     # Create CSV template with headers and sample data
     output = io.StringIO()
-    fieldnames = ['name', 'description', 'amount', 'vat_amount', 'frequency', 'start_date', 'end_date', 'day_of_month', 'day_of_week', 'is_active', 'notes', 'customer_name', 'bank_account_name']
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
+    writer = csv.writer(output)
     
-    writer.writeheader()
+    writer.writerow(_EXPORT_FIELDS)
     # Add sample rows to show the expected format
     sample_data = [
         {
@@ -79,7 +91,7 @@ def get_import_template(
     ]
     
     for row in sample_data:
-        writer.writerow(row)
+        writer.writerow([row[field] for field in _EXPORT_FIELDS])
     
     csv_content = output.getvalue()
     output.close()
@@ -104,6 +116,16 @@ def get_import_template(
         }
     }
 
+# The template never changes, so build it once at import time
+_IMPORT_TEMPLATE_RESPONSE = _build_import_template()
+
+@router.get("/import-template")
+def get_import_template(
+    current_user: User = Depends(get_current_active_user)
+):
+    """Download CSV template for recurring income import"""
+    return _IMPORT_TEMPLATE_RESPONSE
+
 @router.get("/company/{company_id}", response_model=List[RecurringIncomeSchema])
 def get_recurring_income_by_company(
     company_id: int,
@@ -164,14 +186,14 @@ def update_recurring_income(
         
         # Add validation for frequency-specific requirements
         if 'frequency' in update_data or 'day_of_month' in update_data or 'day_of_week' in update_data:
-            frequency = update_data.get('frequency', db_income.frequency)
+            frequency = FrequencyType(update_data.get('frequency', db_income.frequency))
             
             if frequency in ['monthly', 'quarterly']:
                 day_of_month = update_data.get('day_of_month', db_income.day_of_month)
                 if not day_of_month or not (1 <= day_of_month <= 31):
                     raise HTTPException(
                         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                        detail=f"day_of_month (1-31) is required for {frequency} frequency"
+                        detail=f"day_of_month (1-31) is required for {frequency.value} frequency"
                     )
                 # Clear day_of_week for monthly/quarterly
                 update_data['day_of_week'] = None
@@ -201,10 +223,7 @@ def update_recurring_income(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        print(f"Error updating recurring income: {str(e)}")
-        print(f"Update data: {update_data}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Error updating recurring income with data: %s", update_data)
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -243,10 +262,14 @@ def parse_date(date_str: str):
     if not date_str:
         return None
     
-    # Try common date formats
-    date_formats = ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d']
+    # Fast path for the documented YYYY-MM-DD format
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
     
-    for fmt in date_formats:
+    for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
@@ -255,14 +278,13 @@ def parse_date(date_str: str):
     # If no format works, raise an error
     raise ValueError(f"Invalid date format: {date_str}. Expected format: YYYY-MM-DD")
 
-def parse_decimal(value_str: str):
-    """Parse decimal string"""
+def validate_decimal(value_str: str) -> str:
+    """Validate a decimal string and return it as-is for the Numeric column"""
     if not value_str:
-        return Decimal('0.00')
-    try:
-        return Decimal(str(value_str))
-    except (InvalidOperation, ValueError):
+        return '0.00'
+    if not _DECIMAL_RE.match(value_str):
         raise ValueError(f"Invalid decimal value: {value_str}")
+    return value_str
 
 @router.post("/company/{company_id}/import-csv")
 def import_recurring_income_csv(
@@ -279,166 +301,175 @@ def import_recurring_income_csv(
         raise HTTPException(status_code=400, detail="File must be a CSV")
     
     try:
-        # Read the uploaded file
-        content = file.file.read()
-        csv_content = content.decode('utf-8')
-        csv_reader = csv.DictReader(io.StringIO(csv_content))
+        # Decode the uploaded file as it is read instead of buffering it
+        csv_text = io.TextIOWrapper(file.file, encoding='utf-8', newline='')
+        csv_reader = csv.reader(csv_text)
+        
+        # Resolve column positions once from the header row
+        header = next(csv_reader, [])
+        column_index = {column_name: i for i, column_name in enumerate(header)}
+        
+        def get_field(row, key, default=''):
+            i = column_index.get(key)
+            if i is None or i >= len(row):
+                return default
+            return row[i].strip()
         
+        # Load the company's customers and active bank accounts once instead of per row
+        customers = {}
+        for customer_id, customer_name in db.query(Customer.id, Customer.name).filter(
+            Customer.company_id == company_id
+        ).order_by(Customer.id).all():
+            customers.setdefault(customer_name, customer_id)
+        
+        active_bank_accounts = db.query(BankAccount.id, BankAccount.name, BankAccount.is_default).filter(
+            BankAccount.company_id == company_id,
+            BankAccount.is_active == True
+        ).order_by(BankAccount.id).all()
+        bank_accounts = {}
+        for account in active_bank_accounts:
+            bank_accounts.setdefault(account.name, account.id)
+        default_bank_account_id = next((account.id for account in active_bank_accounts if account.is_default), None)
+        available_account_names = ', '.join(account.name for account in active_bank_accounts)
+        
+        pending = []
         imported_items = []
         errors = []
         
-        for row_num, row in enumerate(csv_reader, start=2):  # Start at 2 for header row
+        # Blank lines are skipped, as DictReader did
+        for row_num, row in enumerate((row for row in csv_reader if row), start=2):  # Start at 2 for header row
             try:
-                # Find customer if specified
-                customer_id = None
-                if row.get('customer_name', '').strip():
-                    customer = db.query(Customer).filter(
-                        Customer.name == row['customer_name'].strip(),
-                        Customer.company_id == company_id
-                    ).first()
-                    if customer:
-                        customer_id = customer.id
-                    else:
-                        errors.append(f"Row {row_num}: Customer '{row['customer_name']}' not found")
-                        continue
-                
-                # Find bank account (required) - improved matching
-                bank_account_id = None
-                if row.get('bank_account_name', '').strip():
-                    bank_account_name = row['bank_account_name'].strip()
-                    
-                    # First try exact match
-                    bank_account = db.query(BankAccount).filter(
-                        BankAccount.name == bank_account_name,
-                        BankAccount.company_id == company_id,
-                        BankAccount.is_active == True
-                    ).first()
-                    
-                    # If no exact match, try partial matching
-                    if not bank_account:
-                        # Extract the main name part before account type or balance info
-                        # Handle formats like "YOWI CA (checking) - ₱601,023.27"
-                        main_name = bank_account_name.split('(')[0].strip()  # Get part before parentheses
-                        main_name = main_name.split('-')[0].strip()  # Get part before dash
-                        
-                        # Try to find bank account that starts with the main name
-                        bank_account = db.query(BankAccount).filter(
-                            BankAccount.name.ilike(f"{main_name}%"),
-                            BankAccount.company_id == company_id,
-                            BankAccount.is_active == True
-                        ).first()
-                        
-                        # If still no match, try contains match
-                        if not bank_account:
-                            bank_account = db.query(BankAccount).filter(
-                                BankAccount.name.ilike(f"%{main_name}%"),
-                                BankAccount.company_id == company_id,
-                                BankAccount.is_active == True
-                            ).first()
-                    
-                    if bank_account:
-                        bank_account_id = bank_account.id
-                    else:
-                        # Get available bank accounts for better error message
-                        available_accounts = db.query(BankAccount).filter(
-                            BankAccount.company_id == company_id,
-                            BankAccount.is_active == True
-                        ).all()
-                        account_names = [acc.name for acc in available_accounts]
-                        errors.append(f"Row {row_num}: Bank account '{bank_account_name}' not found or inactive. Available accounts: {', '.join(account_names)}")
-                        continue
-                else:
-                    # If no bank account specified, try to find default
-                    default_bank_account = db.query(BankAccount).filter(
-                        BankAccount.company_id == company_id,
-                        BankAccount.is_active == True,
-                        BankAccount.is_default == True
-                    ).first()
-                    if default_bank_account:
-                        bank_account_id = default_bank_account.id
-                    else:
-                        errors.append(f"Row {row_num}: Bank account is required. Please specify bank_account_name or set a default bank account.")
-                        continue
+                # Run the cheap field checks before any date parsing or name lookups
+                name = get_field(row, 'name')
+                if not name:
+                    errors.append(f"Row {row_num}: Name is required")
+                    continue
                 
                 # Validate frequency
-                frequency = row.get('frequency', '').strip().lower()
-                if frequency not in ['weekly', 'monthly', 'quarterly', 'annually']:
+                frequency = get_field(row, 'frequency').lower()
+                if frequency not in _VALID_FREQUENCIES:
                     errors.append(f"Row {row_num}: Invalid frequency '{frequency}'. Must be: weekly, monthly, quarterly, annually")
                     continue
                 
+                # Validate is_active
+                is_active = get_field(row, 'is_active', 'active').lower()
+                if is_active not in _VALID_STATUSES:
+                    errors.append(f"Row {row_num}: is_active must be: active, paused, or ended")
+                    continue
+                
+                amount = validate_decimal(get_field(row, 'amount', '0'))
+                if float(amount) <= 0:
+                    errors.append(f"Row {row_num}: Amount must be greater than 0")
+                    continue
+                vat_amount = validate_decimal(get_field(row, 'vat_amount', '0'))
+                
                 # Parse dates
-                start_date = parse_date(row.get('start_date', '').strip())
+                start_date = parse_date(get_field(row, 'start_date'))
                 if not start_date:
                     errors.append(f"Row {row_num}: Start date is required")
                     continue
                 
-                end_date = parse_date(row.get('end_date', '').strip()) if row.get('end_date', '').strip() else None
+                end_date_str = get_field(row, 'end_date')
+                end_date = parse_date(end_date_str) if end_date_str else None
                 
                 # Parse day fields
                 day_of_month = None
                 day_of_week = None
                 
                 if frequency in ['monthly', 'quarterly']:
-                    if not row.get('day_of_month', '').strip():
+                    day_of_month_str = get_field(row, 'day_of_month')
+                    if not day_of_month_str:
                         errors.append(f"Row {row_num}: day_of_month is required for {frequency} frequency")
                         continue
                     try:
-                        day_of_month = int(row['day_of_month'])
+                        day_of_month = int(day_of_month_str)
                         if not (1 <= day_of_month <= 31):
                             errors.append(f"Row {row_num}: day_of_month must be between 1 and 31")
                             continue
                     except ValueError:
-                        errors.append(f"Row {row_num}: Invalid day_of_month '{row['day_of_month']}'")
+                        errors.append(f"Row {row_num}: Invalid day_of_month '{day_of_month_str}'")
                         continue
                 
                 if frequency == 'weekly':
-                    if not row.get('day_of_week', '').strip():
+                    day_of_week_str = get_field(row, 'day_of_week')
+                    if not day_of_week_str:
                         errors.append(f"Row {row_num}: day_of_week is required for weekly frequency")
                         continue
                     try:
-                        day_of_week = int(row['day_of_week'])
+                        day_of_week = int(day_of_week_str)
                         if not (0 <= day_of_week <= 6):
                             errors.append(f"Row {row_num}: day_of_week must be between 0 (Monday) and 6 (Sunday)")
                             continue
                     except ValueError:
-                        errors.append(f"Row {row_num}: Invalid day_of_week '{row['day_of_week']}'")
+                        errors.append(f"Row {row_num}: Invalid day_of_week '{day_of_week_str}'")
+                        continue
+                
+                # Find customer if specified
+                customer_id = None
+                customer_name = get_field(row, 'customer_name')
+                if customer_name:
+                    customer_id = customers.get(customer_name)
+                    if customer_id is None:
+                        errors.append(f"Row {row_num}: Customer '{customer_name}' not found")
+                        continue
+                
+                # Find bank account (required) - improved matching
+                bank_account_id = None
+                bank_account_name = get_field(row, 'bank_account_name')
+                if bank_account_name:
+                    # First try exact match
+                    bank_account_id = bank_accounts.get(bank_account_name)
+                    
+                    # If no exact match, try partial matching
+                    if bank_account_id is None:
+                        # Extract the main name part before account type or balance info
+                        # Handle formats like "YOWI CA (checking) - ₱601,023.27"
+                        main_name = bank_account_name.split('(')[0].strip()  # Get part before parentheses
+                        main_name = main_name.split('-')[0].strip().lower()  # Get part before dash
+                        
+                        # Try to find bank account that starts with the main name
+                        bank_account_id = next(
+                            (account.id for account in active_bank_accounts if account.name.lower().startswith(main_name)),
+                            None
+                        )
+                        
+                        # If still no match, try contains match
+                        if bank_account_id is None:
+                            bank_account_id = next(
+                                (account.id for account in active_bank_accounts if main_name in account.name.lower()),
+                                None
+                            )
+                    
+                    if bank_account_id is None:
+                        errors.append(f"Row {row_num}: Bank account '{bank_account_name}' not found or inactive. Available accounts: {available_account_names}")
+                        continue
+                else:
+                    # If no bank account specified, use the default
+                    bank_account_id = default_bank_account_id
+                    if bank_account_id is None:
+                        errors.append(f"Row {row_num}: Bank account is required. Please specify bank_account_name or set a default bank account.")
                         continue
                 
                 # Map CSV columns to recurring income fields
                 income_data = {
-                    'name': row.get('name', '').strip(),
-                    'description': row.get('description', '').strip() or None,
-                    'amount': parse_decimal(row.get('amount', '0')),
-                    'vat_amount': parse_decimal(row.get('vat_amount', '0')),
+                    'name': name,
+                    'description': get_field(row, 'description') or None,
+                    'amount_cents': to_cents(amount),
+                    'vat_amount': vat_amount,
                     'frequency': frequency,
                     'start_date': start_date,
                     'end_date': end_date,
                     'day_of_month': day_of_month,
                     'day_of_week': day_of_week,
-                    'is_active': row.get('is_active', 'active').strip().lower(),
-                    'notes': row.get('notes', '').strip() or None,
+                    'is_active': is_active,
+                    'notes': get_field(row, 'notes') or None,
                     'company_id': company_id,
                     'customer_id': customer_id,
                     'bank_account_id': bank_account_id
                 }
                 
-                # Validate required fields
-                if not income_data['name']:
-                    errors.append(f"Row {row_num}: Name is required")
-                    continue
-                
-                if income_data['amount'] <= 0:
-                    errors.append(f"Row {row_num}: Amount must be greater than 0")
-                    continue
-                
-                # Validate is_active
-                if income_data['is_active'] not in ['active', 'paused', 'ended']:
-                    errors.append(f"Row {row_num}: is_active must be: active, paused, or ended")
-                    continue
-                
-                # Create recurring income
-                db_income = RecurringIncome(**income_data)
-                db.add(db_income)
+                # Queue recurring income for a single bulk insert
+                pending.append(income_data)
                 imported_items.append(income_data['name'])
                 
             except ValueError as e:
@@ -447,7 +478,8 @@ def import_recurring_income_csv(
                 errors.append(f"Row {row_num}: {str(e)}")
         
         # Commit all successful imports
-        if imported_items:
+        if pending:
+            db.bulk_insert_mappings(RecurringIncome, pending)
             db.commit()
         
         return {
@@ -472,53 +504,66 @@ def export_recurring_income_csv(
     """Export recurring income to CSV format"""
     verify_company_ownership(db, company_id, current_user.id)
     
-    # Get all recurring income for the company with customer names
-    recurring_income = db.query(RecurringIncome).filter(
-        RecurringIncome.company_id == company_id
-    ).all()
-    
-    # Create CSV content
-    output = io.StringIO()
-    fieldnames = ['name', 'description', 'amount', 'vat_amount', 'frequency', 'start_date', 'end_date', 'day_of_month', 'day_of_week', 'is_active', 'notes', 'customer_name', 'bank_account_name']
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    
-    writer.writeheader()
-    for income in recurring_income:
-        # Get customer name if customer_id exists
-        customer_name = ''
-        if income.customer_id:
-            customer = db.query(Customer).filter(Customer.id == income.customer_id).first()
-            if customer:
-                customer_name = customer.name
-        
-        # Get bank account name if bank_account_id exists
-        bank_account_name = ''
-        if income.bank_account_id:
-            bank_account = db.query(BankAccount).filter(BankAccount.id == income.bank_account_id).first()
-            if bank_account:
-                bank_account_name = bank_account.name
-        
-        writer.writerow({
-            'name': income.name,
-            'description': income.description or '',
-            'amount': str(income.amount),
-            'vat_amount': str(income.vat_amount or 0),
-            'frequency': income.frequency,
-            'start_date': income.start_date.strftime('%Y-%m-%d') if income.start_date else '',
-            'end_date': income.end_date.strftime('%Y-%m-%d') if income.end_date else '',
-            'day_of_month': str(income.day_of_month) if income.day_of_month else '',
-            'day_of_week': str(income.day_of_week) if income.day_of_week is not None else '',
-            'is_active': income.is_active or 'active',
-            'notes': income.notes or '',
-            'customer_name': customer_name,
-            'bank_account_name': bank_account_name
-        })
-    
-    csv_content = output.getvalue()
-    output.close()
+    def iter_csv():
+        # The request session is closed before the response body is streamed, so use a dedicated one
+        stream_db = SessionLocal()
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        try:
+            writer.writerow(_EXPORT_FIELDS)
+            yield buffer.getvalue()
+            
+            # Select only the exported columns, with customer and bank account names joined in
+            rows = stream_db.execute(
+                select(
+                    RecurringIncome.name,
+                    RecurringIncome.description,
+                    RecurringIncome.amount_cents,
+                    RecurringIncome.vat_amount,
+                    RecurringIncome.frequency,
+                    RecurringIncome.start_date,
+                    RecurringIncome.end_date,
+                    RecurringIncome.day_of_month,
+                    RecurringIncome.day_of_week,
+                    RecurringIncome.is_active,
+                    RecurringIncome.notes,
+                    Customer.name.label('customer_name'),
+                    BankAccount.name.label('bank_account_name')
+                ).select_from(RecurringIncome).outerjoin(
+                    Customer, RecurringIncome.customer_id == Customer.id
+                ).outerjoin(
+                    BankAccount, RecurringIncome.bank_account_id == BankAccount.id
+                ).where(
+                    RecurringIncome.company_id == company_id
+                ).order_by(RecurringIncome.id).execution_options(yield_per=1000)
+            )
+            
+            for (name, description, amount_cents, vat_amount, frequency, start_date, end_date,
+                 day_of_month, day_of_week, is_active, notes, customer_name, bank_account_name) in rows:
+                buffer.seek(0)
+                buffer.truncate(0)
+                writer.writerow((
+                    name,
+                    description or '',
+                    str(from_cents(amount_cents)),
+                    str(vat_amount or 0),
+                    frequency,
+                    start_date.strftime('%Y-%m-%d') if start_date else '',
+                    end_date.strftime('%Y-%m-%d') if end_date else '',
+                    str(day_of_month) if day_of_month else '',
+                    str(day_of_week) if day_of_week is not None else '',
+                    is_active or 'active',
+                    notes or '',
+                    customer_name or '',
+                    bank_account_name or ''
+                ))
+                yield buffer.getvalue()
+        finally:
+            buffer.close()
+            stream_db.close()
     
-    return {
-        "filename": f"recurring_income_export_{company_id}.csv",
-        "content": csv_content,
-        "count": len(recurring_income)
-    }
\ No newline at end of file
+    return StreamingResponse(
+        iter_csv(),
+        media_type='text/csv; charset=utf-8',
+        headers={'Content-Disposition': f'attachment; filename="recurring_income_export_{company_id}.csv"'}
+    )
\ No newline at end of file
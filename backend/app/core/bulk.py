@@ -0,0 +1,57 @@
+import io
+from contextlib import contextmanager
+from typing import Sequence
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+def bulk_insert(session: Session, model, rows: Sequence[dict], page_size: int = 10_000) -> None:
+    """Insert plain dict rows in pages without building ORM instances"""
+    for start in range(0, len(rows), page_size):
+        session.execute(insert(model), rows[start:start + page_size])
+
+def _copy_field(value) -> str:
+    """CSV field for COPY: NULL is a bare empty field, every value is quoted so none can read as NULL"""
+    if value is None:
+        return ''
+    return '"' + str(value).replace('"', '""') + '"'
+
+def bulk_copy(session: Session, model, rows: Sequence[dict], min_rows: int = 100) -> None:
+    """Stream dict rows through COPY on psycopg2, falling back to bulk_insert elsewhere"""
+    if not rows:
+        return
+    connection = session.connection()
+    # COPY's setup only pays off past a handful of rows; small batches go through one INSERT
+    if connection.dialect.driver != "psycopg2" or len(rows) < min_rows:
+        bulk_insert(session, model, rows)
+        return
+
+    columns = list(rows[0])
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write(','.join(_copy_field(row.get(column)) for column in columns))
+        buffer.write('\n')
+    buffer.seek(0)
+
+    cursor = connection.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {model.__table__.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+    finally:
+        cursor.close()
+
+@contextmanager
+def bulk_txn(session: Session):
+    """Run a block of bulk writes as a single transaction"""
+    if session.in_transaction():
+        # Request sessions have usually autobegun a transaction already (e.g. the user lookup)
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+    else:
+        with session.begin():
+            yield session
@@ -1,4 +1,5 @@
 import os
+from typing import List
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
@@ -10,5 +11,11 @@ class Settings(BaseModel):
     secret_key: str = os.getenv("SECRET_KEY", "your-secret-key-change-this-in-production")
     algorithm: str = os.getenv("ALGORITHM", "HS256")
     access_token_expire_minutes: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    # Sync route handlers run on a threadpool; by default allow one thread per pooled connection
+    threadpool_limit: int = int(os.getenv("THREADPOOL_LIMIT", str(db_pool_size + db_max_overflow)))
+    # Comma-separated list of allowed CORS origins; "*" allows any origin
+    cors_origins: List[str] = [origin.strip() for origin in os.getenv("CORS_ORIGINS", "*").split(",") if origin.strip()]
 
 settings = Settings()
\ No newline at end of file
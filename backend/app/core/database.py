@@ -1,9 +1,36 @@
-from sqlalchemy import create_engine
+import sqlite3
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
-engine = create_engine(settings.database_url)
+engine_kwargs = {
+    "pool_pre_ping": True,
+    "insertmanyvalues_page_size": 10000,
+    # Headroom over the default 500 so per-variant filter combinations stay cached
+    "query_cache_size": 1200,
+}
+if not settings.database_url.startswith("sqlite"):
+    # Keep enough pooled connections for the request threadpool
+    engine_kwargs.update(pool_size=settings.db_pool_size, max_overflow=settings.db_max_overflow)
+if settings.database_url.startswith(("postgresql+psycopg2://", "postgresql://")):
+    # psycopg2 only: batch the executemany statements that insertmanyvalues doesn't cover
+    engine_kwargs["executemany_mode"] = "values_plus_batch"
+
+@event.listens_for(Engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Enable WAL and relaxed fsync on every SQLite connection"""
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.close()
+
+engine = create_engine(settings.database_url, **engine_kwargs)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
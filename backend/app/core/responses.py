@@ -0,0 +1,15 @@
+from decimal import Decimal
+from typing import Any
+import orjson
+from fastapi.responses import ORJSONResponse
+
+def _default(obj: Any):
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class DecimalORJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also serializes Decimal values"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default)
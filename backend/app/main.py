@@ -6,7 +6,10 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
 import logging
 import traceback
+from contextlib import asynccontextmanager
+from anyio import to_thread
 from app.core.config import settings
+from app.core.responses import DecimalORJSONResponse
 from app.api import companies, users, customers, transactions, auth
 from app.api.v1 import recurring_income, recurring_expenses, projections, one_off_items, expense_categories, bank_accounts
 
@@ -14,29 +17,58 @@ from app.api.v1 import recurring_income, recurring_expenses, projections, one_of
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync route handlers share anyio's default thread limiter; size it to the DB connection pool
+    to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_limit
+    yield
+
 app = FastAPI(
     title="Cash Flow Management API",
     description="A comprehensive cash flow management system",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=DecimalORJSONResponse,
+    lifespan=lifespan
 )
 
+# CORS headers are the same for every response, so build them once
+ALLOWED_ORIGINS = frozenset(settings.cors_origins)
+ALLOW_ALL_ORIGINS = "*" in ALLOWED_ORIGINS
+CORS_HEADERS = {
+    "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS, HEAD",
+    "Access-Control-Allow-Headers": "*",
+    "Access-Control-Expose-Headers": "*",
+    "Access-Control-Max-Age": "3600",
+}
+
+def add_cors_headers(request: Request, response: Response) -> Response:
+    if ALLOW_ALL_ORIGINS:
+        response.headers["Access-Control-Allow-Origin"] = "*"
+    else:
+        origin = request.headers.get("origin")
+        if origin in ALLOWED_ORIGINS:
+            response.headers["Access-Control-Allow-Origin"] = origin
+        # The allow header depends on the request's Origin, so shared caches must key on it
+        vary = response.headers.get("Vary")
+        if not vary:
+            response.headers["Vary"] = "Origin"
+        elif "origin" not in vary.lower():
+            response.headers["Vary"] = f"{vary}, Origin"
+    response.headers.update(CORS_HEADERS)
+    return response
+
 # Custom CORS middleware for GitHub Codespaces
 class CORSFixMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
         response = await call_next(request)
-        response.headers["Access-Control-Allow-Origin"] = "*"
-        response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS, HEAD"
-        response.headers["Access-Control-Allow-Headers"] = "*"
-        response.headers["Access-Control-Expose-Headers"] = "*"
-        response.headers["Access-Control-Max-Age"] = "3600"
-        return response
+        return add_cors_headers(request, response)
 
 app.add_middleware(CORSFixMiddleware)
 
 # Also add standard CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=settings.cors_origins,
     allow_credentials=False,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "HEAD"],
     allow_headers=["*"],
@@ -46,12 +78,8 @@ app.add_middleware(
 
 # Handle preflight OPTIONS requests
 @app.options("/{full_path:path}")
-async def preflight_handler():
-    response = Response()
-    response.headers["Access-Control-Allow-Origin"] = "*"
-    response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS, HEAD"
-    response.headers["Access-Control-Allow-Headers"] = "*"
-    return response
+async def preflight_handler(request: Request):
+    return add_cors_headers(request, Response())
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -62,12 +90,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         status_code=422,
         content={"detail": exc.errors(), "body": exc.body},
     )
-    response.headers["Access-Control-Allow-Origin"] = "*"
-    response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS, HEAD"
-    response.headers["Access-Control-Allow-Headers"] = "*"
-    response.headers["Access-Control-Expose-Headers"] = "*"
-    response.headers["Access-Control-Max-Age"] = "3600"
-    return response
+    return add_cors_headers(request, response)
 
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
@@ -82,12 +105,7 @@ async def log_requests(request: Request, call_next):
             status_code=500,
             content={"detail": "Internal Server Error"}
         )
-        error_response.headers["Access-Control-Allow-Origin"] = "*"
-        error_response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS, HEAD"
-        error_response.headers["Access-Control-Allow-Headers"] = "*"
-        error_response.headers["Access-Control-Expose-Headers"] = "*"
-        error_response.headers["Access-Control-Max-Age"] = "3600"
-        return error_response
+        return add_cors_headers(request, error_response)
 
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["authentication"])
 app.include_router(users.router, prefix="/api/v1/users", tags=["users"])
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Numeric, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Numeric, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
 
 class BankAccount(Base):
     __tablename__ = "bank_accounts"
+    __table_args__ = (
+        Index("ix_bank_accounts_company_id_name", "company_id", "name"),
+        Index("ix_bank_accounts_company_id_default", "company_id", "is_default", "is_active"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
@@ -20,7 +24,7 @@ class BankAccount(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
-    company = relationship("Company", back_populates="bank_accounts")
+    company = relationship("Company", back_populates="bank_accounts", innerjoin=True)
     recurring_incomes = relationship("RecurringIncome", back_populates="bank_account")
     recurring_expenses = relationship("RecurringExpense", back_populates="bank_account")
     one_off_items = relationship("OneOffItem", back_populates="bank_account")
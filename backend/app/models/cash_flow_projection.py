@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Numeric
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Text, Numeric, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -6,9 +6,14 @@ from app.core.database import Base
 class CashFlowProjection(Base):
     """Generated projections for visualization - calculated from recurring patterns"""
     __tablename__ = "cash_flow_projections"
+    __table_args__ = (
+        Index("ix_cash_flow_projections_company_id_projection_date", "company_id", "projection_date"),
+        # Reads always pick one account (or the NULL consolidated view) and scan by date
+        Index("ix_cash_flow_projections_company_id_bank_account_id_projection_date", "company_id", "bank_account_id", "projection_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    projection_date = Column(DateTime(timezone=True), nullable=False, index=True)
+    projection_date = Column(Date, nullable=False)
     income_amount = Column(Numeric(15, 2), default=0.0)
     expense_amount = Column(Numeric(15, 2), default=0.0)
     net_flow = Column(Numeric(15, 2), default=0.0)
@@ -18,15 +23,18 @@ class CashFlowProjection(Base):
     company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
     bank_account_id = Column(Integer, ForeignKey("bank_accounts.id"))  # Optional, for account-specific projections
     
-    company = relationship("Company", back_populates="projections")
+    company = relationship("Company", back_populates="projections", innerjoin=True)
     bank_account = relationship("BankAccount", back_populates="projections")
 
 class ProjectionItem(Base):
     """Individual items that make up a projection (for detailed breakdown)"""
     __tablename__ = "projection_items"
+    __table_args__ = (
+        Index("ix_projection_items_company_id_projection_date", "company_id", "projection_date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    projection_date = Column(DateTime(timezone=True), nullable=False, index=True)
+    projection_date = Column(Date, nullable=False)
     item_name = Column(String, nullable=False)
     item_type = Column(String, nullable=False)  # "income" or "expense"
     amount = Column(Numeric(15, 2), nullable=False)
@@ -38,5 +46,5 @@ class ProjectionItem(Base):
     company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
     bank_account_id = Column(Integer, ForeignKey("bank_accounts.id"))  # Optional, for account-specific items
     
-    company = relationship("Company")
+    company = relationship("Company", innerjoin=True)
     bank_account = relationship("BankAccount")
\ No newline at end of file
@@ -22,11 +22,12 @@ class Company(Base):
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     
     owner = relationship("User", back_populates="companies")
-    customers = relationship("Customer", back_populates="company")
-    transactions = relationship("Transaction", back_populates="company")
-    expenses = relationship("Expense", back_populates="company")
-    recurring_income = relationship("RecurringIncome", back_populates="company")
-    recurring_expenses = relationship("RecurringExpense", back_populates="company")
-    one_off_items = relationship("OneOffItem", back_populates="company")
-    projections = relationship("CashFlowProjection", back_populates="company")
+    # Collections must be loaded explicitly (e.g. selectinload) so accidental N+1 lazy loads fail loudly
+    customers = relationship("Customer", back_populates="company", lazy="raise_on_sql")
+    transactions = relationship("Transaction", back_populates="company", lazy="raise_on_sql")
+    expenses = relationship("Expense", back_populates="company", lazy="raise_on_sql")
+    recurring_income = relationship("RecurringIncome", back_populates="company", lazy="raise_on_sql")
+    recurring_expenses = relationship("RecurringExpense", back_populates="company", lazy="raise_on_sql")
+    one_off_items = relationship("OneOffItem", back_populates="company", lazy="raise_on_sql")
+    projections = relationship("CashFlowProjection", back_populates="company", lazy="raise_on_sql")
     bank_accounts = relationship("BankAccount", back_populates="company")
\ No newline at end of file
@@ -1,10 +1,13 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean, Date
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean, Date, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
 
 class Customer(Base):
     __tablename__ = "customers"
+    __table_args__ = (
+        Index("ix_customers_company_id_name", "company_id", "name"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False, index=True)
@@ -28,6 +31,6 @@ class Customer(Base):
     
     company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
     
-    company = relationship("Company", back_populates="customers")
-    transactions = relationship("Transaction", back_populates="customer")
-    recurring_income = relationship("RecurringIncome", back_populates="customer")
\ No newline at end of file
+    company = relationship("Company", back_populates="customers", innerjoin=True)
+    transactions = relationship("Transaction", back_populates="customer", lazy="raise_on_sql")
+    recurring_income = relationship("RecurringIncome", back_populates="customer", lazy="raise_on_sql")
\ No newline at end of file
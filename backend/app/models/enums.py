@@ -0,0 +1,27 @@
+import enum
+
+class ActiveState(str, enum.Enum):
+    ACTIVE = "active"
+    PAUSED = "paused"
+    ENDED = "ended"
+
+class ConfirmationState(str, enum.Enum):
+    PLANNED = "planned"
+    CONFIRMED = "confirmed"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+
+class FrequencyType(str, enum.Enum):
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+    QUARTERLY = "quarterly"
+    ANNUALLY = "annually"
+
+def enum_values(enum_class):
+    """Store enum values ("active") rather than member names ("ACTIVE")"""
+    return [member.value for member in enum_class]
+
+def enum_check(column, enum_class):
+    """SQL condition restricting a column to the enum's stored values"""
+    values = ", ".join(f"'{value}'" for value in enum_values(enum_class))
+    return f"{column} IN ({values})"
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Numeric, Date
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Numeric, Date, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
+from app.models.money import AmountCentsMixin
 
 class ExpenseCategory(Base):
     __tablename__ = "expense_categories"
@@ -15,12 +16,15 @@ class ExpenseCategory(Base):
     recurring_expenses = relationship("RecurringExpense", back_populates="category")
     one_off_items = relationship("OneOffItem", back_populates="category")
 
-class Expense(Base):
+class Expense(AmountCentsMixin, Base):
     __tablename__ = "expenses"
+    __table_args__ = (
+        Index("ix_expenses_company_id_expense_date", "company_id", "expense_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     description = Column(String, nullable=False)
-    amount = Column(Numeric(15, 2), nullable=False)
+    # amount is stored as integer cents (amount_cents) via AmountCentsMixin
     vat_amount = Column(Numeric(15, 2), default=0)
     expense_date = Column(Date, nullable=False)
     receipt_number = Column(String)
@@ -32,5 +36,5 @@ class Expense(Base):
     company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
     category_id = Column(Integer, ForeignKey("expense_categories.id"), nullable=True)
     
-    company = relationship("Company", back_populates="expenses")
+    company = relationship("Company", back_populates="expenses", innerjoin=True)
     category = relationship("ExpenseCategory", back_populates="expenses")
\ No newline at end of file
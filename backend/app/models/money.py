@@ -0,0 +1,31 @@
+from decimal import Decimal, ROUND_HALF_UP
+from sqlalchemy import Column, BigInteger, Numeric, type_coerce
+from sqlalchemy.ext.hybrid import hybrid_property
+
+_CENT = Decimal('0.01')
+
+def to_cents(value) -> int:
+    """Convert a decimal amount (Decimal, str, int or float) to integer cents"""
+    return int((Decimal(str(value)) * 100).quantize(Decimal('1'), rounding=ROUND_HALF_UP))
+
+def from_cents(cents):
+    """Convert integer cents back to a two-place Decimal"""
+    if cents is None:
+        return None
+    return Decimal(cents).scaleb(-2).quantize(_CENT)
+
+class AmountCentsMixin:
+    """Stores the amount as BIGINT cents while exposing a Decimal `amount`"""
+    amount_cents = Column(BigInteger, nullable=False)
+
+    @hybrid_property
+    def amount(self):
+        return from_cents(self.amount_cents)
+
+    @amount.setter
+    def amount(self, value):
+        self.amount_cents = None if value is None else to_cents(value)
+
+    @amount.expression
+    def amount(cls):
+        return type_coerce(cls.amount_cents, Numeric(15, 2)) / 100
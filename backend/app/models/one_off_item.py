@@ -1,10 +1,15 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Numeric
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Numeric, Index, Enum, CheckConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
+from app.models.enums import ConfirmationState, enum_values, enum_check
 
 class OneOffItem(Base):
     __tablename__ = "one_off_items"
+    __table_args__ = (
+        Index("ix_one_off_items_company_id_planned_date", "company_id", "planned_date"),
+        CheckConstraint(enum_check("is_confirmed", ConfirmationState), name="ck_one_off_items_is_confirmed"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False, index=True)
@@ -13,7 +18,7 @@ class OneOffItem(Base):
     vat_amount = Column(Numeric(15, 2), default=0.0)
     item_type = Column(String, nullable=False)  # income or expense
     planned_date = Column(DateTime(timezone=True), nullable=False)  # When this is expected to occur
-    is_confirmed = Column(String, default="planned")  # planned, confirmed, completed, cancelled
+    is_confirmed = Column(Enum(ConfirmationState, name="confirmation_state", native_enum=False, values_callable=enum_values), default=ConfirmationState.PLANNED, nullable=False)
     source = Column(String)  # Who you receive from / pay to
     reference = Column(String)  # Reference numbers, etc.
     notes = Column(Text)
@@ -24,6 +29,6 @@ class OneOffItem(Base):
     category_id = Column(Integer, ForeignKey("expense_categories.id"))  # Optional for expenses
     bank_account_id = Column(Integer, ForeignKey("bank_accounts.id"))  # Optional, defaults to primary account
     
-    company = relationship("Company", back_populates="one_off_items")
+    company = relationship("Company", back_populates="one_off_items", innerjoin=True)
     category = relationship("ExpenseCategory", back_populates="one_off_items")
     bank_account = relationship("BankAccount", back_populates="one_off_items")
\ No newline at end of file
@@ -1,30 +1,39 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Numeric
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Numeric, Index, Enum, CheckConstraint, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
+from app.models.money import AmountCentsMixin
+from app.models.enums import ActiveState, FrequencyType, enum_values, enum_check
 
-class RecurringIncome(Base):
+class RecurringIncome(AmountCentsMixin, Base):
     __tablename__ = "recurring_income"
+    __table_args__ = (
+        Index("ix_recurring_income_company_id_is_active", "company_id", "is_active"),
+        # Partial on Postgres so only active streams are indexed by start date
+        Index("ix_recurring_income_active_company_id_start_date", "company_id", "start_date", postgresql_where=text("is_active = 'active'")),
+        CheckConstraint(enum_check("is_active", ActiveState), name="ck_recurring_income_is_active"),
+        CheckConstraint(enum_check("frequency", FrequencyType), name="ck_recurring_income_frequency"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False, index=True)
     description = Column(Text)
-    amount = Column(Numeric(15, 2), nullable=False)
+    # amount is stored as integer cents (amount_cents) via AmountCentsMixin
     vat_amount = Column(Numeric(15, 2), default=0.0)
-    frequency = Column(String, nullable=False)  # weekly, monthly, quarterly, annually
+    frequency = Column(Enum(FrequencyType, name="frequency_type", native_enum=False, values_callable=enum_values), nullable=False)
     start_date = Column(DateTime(timezone=True), nullable=False)
     end_date = Column(DateTime(timezone=True))  # Optional, for income streams that end
     day_of_month = Column(Integer)  # For monthly/quarterly (1-31)
     day_of_week = Column(Integer)   # For weekly (0=Monday, 6=Sunday)
-    is_active = Column(String, default="active")  # active, paused, ended
+    is_active = Column(Enum(ActiveState, name="active_state", native_enum=False, values_callable=enum_values), default=ActiveState.ACTIVE, nullable=False)
     notes = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
-    customer_id = Column(Integer, ForeignKey("customers.id"))  # Optional
-    bank_account_id = Column(Integer, ForeignKey("bank_accounts.id"))  # Optional, defaults to primary account
+    customer_id = Column(Integer, ForeignKey("customers.id"), index=True)  # Optional
+    bank_account_id = Column(Integer, ForeignKey("bank_accounts.id"), index=True)  # Optional, defaults to primary account
     
-    company = relationship("Company", back_populates="recurring_income")
+    company = relationship("Company", back_populates="recurring_income", innerjoin=True)
     customer = relationship("Customer", back_populates="recurring_income")
     bank_account = relationship("BankAccount", back_populates="recurring_incomes")
\ No newline at end of file
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Numeric, Enum, Date
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Numeric, Enum, Date, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
+from app.models.money import AmountCentsMixin
 import enum
 
 class TransactionType(str, enum.Enum):
@@ -13,12 +14,15 @@ class TransactionStatus(str, enum.Enum):
     COMPLETED = "completed"
     CANCELLED = "cancelled"
 
-class Transaction(Base):
+class Transaction(AmountCentsMixin, Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        Index("ix_transactions_company_id_transaction_date", "company_id", "transaction_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     description = Column(String, nullable=False)
-    amount = Column(Numeric(15, 2), nullable=False)
+    # amount is stored as integer cents (amount_cents) via AmountCentsMixin
     vat_amount = Column(Numeric(15, 2), default=0)
     type = Column(Enum(TransactionType), nullable=False)
     status = Column(Enum(TransactionStatus), default=TransactionStatus.PENDING)
@@ -31,7 +35,7 @@ class Transaction(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
-    customer_id = Column(Integer, ForeignKey("customers.id"), nullable=True)
+    customer_id = Column(Integer, ForeignKey("customers.id"), nullable=True, index=True)
     
-    company = relationship("Company", back_populates="transactions")
+    company = relationship("Company", back_populates="transactions", innerjoin=True)
     customer = relationship("Customer", back_populates="transactions")
\ No newline at end of file
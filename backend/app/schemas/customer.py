@@ -1,7 +1,23 @@
-from pydantic import BaseModel, field_validator
-from typing import Optional
+from pydantic import BaseModel, TypeAdapter, model_validator
+from typing import List, Optional
 from datetime import datetime, date
 
+_NULLABLE_TEXT_FIELDS = frozenset({
+    'email', 'phone', 'address', 'contact_person', 'notes',
+    'company_name', 'product_type', 'revenue_model', 'partner', 'contract_start',
+})
+
+def _empty_strings_to_none(model, data, fields):
+    """Map '' to None for the given keys in a single pass over dict or ORM input"""
+    if isinstance(data, dict):
+        if any(data.get(k) == '' for k in fields):
+            data = {k: None if k in fields and v == '' else v for k, v in data.items()}
+    elif any(getattr(data, k, None) == '' for k in fields):
+        # from_attributes input (e.g. CustomerList over ORM rows): read the fields into a dict
+        data = {k: getattr(data, k) for k in model.model_fields if hasattr(data, k)}
+        data = {k: None if k in fields and v == '' else v for k, v in data.items()}
+    return data
+
 class CustomerBase(BaseModel):
     name: str
     email: Optional[str] = None
@@ -19,19 +35,10 @@ class CustomerBase(BaseModel):
     partner: Optional[str] = None
     contract_start: Optional[date] = None
     
-    @field_validator('email', 'phone', 'address', 'contact_person', 'notes', 'company_name', 'product_type', 'revenue_model', 'partner', mode='before')
+    @model_validator(mode='before')
     @classmethod
-    def validate_empty_strings(cls, v):
-        if v == '':
-            return None
-        return v
-    
-    @field_validator('contract_start', mode='before')
-    @classmethod
-    def validate_contract_start(cls, v):
-        if v == '' or v is None:
-            return None
-        return v
+    def _empty_to_none(cls, data):
+        return _empty_strings_to_none(cls, data, _NULLABLE_TEXT_FIELDS)
 
 class CustomerCreate(CustomerBase):
     company_id: int
@@ -53,12 +60,10 @@ class CustomerUpdate(BaseModel):
     partner: Optional[str] = None
     contract_start: Optional[date] = None
     
-    @field_validator('contract_start', mode='before')
+    @model_validator(mode='before')
     @classmethod
-    def validate_contract_start(cls, v):
-        if v == '' or v is None:
-            return None
-        return v
+    def _empty_to_none(cls, data):
+        return _empty_strings_to_none(cls, data, ('contract_start',))
 
 class Customer(CustomerBase):
     id: int
@@ -67,4 +72,7 @@ class Customer(CustomerBase):
     updated_at: Optional[datetime] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# Prebuilt adapter for list endpoints that render ORM rows straight to JSON
+CustomerList = TypeAdapter(List[Customer])
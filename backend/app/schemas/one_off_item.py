@@ -1,7 +1,8 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from decimal import Decimal
+from app.models.enums import ConfirmationState
 
 class OneOffItemBase(BaseModel):
     name: str
@@ -10,7 +11,7 @@ class OneOffItemBase(BaseModel):
     vat_amount: Optional[Decimal] = Decimal('0.00')
     item_type: str  # income or expense
     planned_date: datetime
-    is_confirmed: Optional[str] = "planned"  # planned, confirmed, completed, cancelled
+    is_confirmed: ConfirmationState = ConfirmationState.PLANNED
     source: Optional[str] = None  # Who you receive from / pay to
     reference: Optional[str] = None
     notes: Optional[str] = None
@@ -27,7 +28,7 @@ class OneOffItemUpdate(BaseModel):
     vat_amount: Optional[Decimal] = None
     item_type: Optional[str] = None
     planned_date: Optional[datetime] = None
-    is_confirmed: Optional[str] = None
+    is_confirmed: Optional[ConfirmationState] = None
     source: Optional[str] = None
     reference: Optional[str] = None
     notes: Optional[str] = None
@@ -38,4 +39,7 @@ class OneOffItem(OneOffItemBase):
     
     id: int
     created_at: datetime
-    updated_at: Optional[datetime] = None
\ No newline at end of file
+    updated_at: Optional[datetime] = None
+
+# Prebuilt adapter for list endpoints that render ORM rows straight to JSON
+OneOffItemList = TypeAdapter(List[OneOffItem])
@@ -4,7 +4,7 @@ from typing import List, Optional
 from decimal import Decimal
 
 class ProjectionItemBase(BaseModel):
-    projection_date: datetime
+    projection_date: date
     item_name: str
     item_type: str  # "income" or "expense"
     amount: Decimal
@@ -20,7 +20,7 @@ class ProjectionItem(ProjectionItemBase):
     created_at: datetime
 
 class CashFlowProjectionBase(BaseModel):
-    projection_date: datetime
+    projection_date: date
     income_amount: Optional[Decimal] = Decimal('0.00')
     expense_amount: Optional[Decimal] = Decimal('0.00')
     net_flow: Optional[Decimal] = Decimal('0.00')
@@ -2,18 +2,19 @@ from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from typing import Optional
 from decimal import Decimal
+from app.models.enums import ActiveState, FrequencyType
 
 class RecurringExpenseBase(BaseModel):
     name: str
     description: Optional[str] = None
     amount: Decimal
     vat_amount: Optional[Decimal] = Decimal('0.00')
-    frequency: str  # weekly, monthly, quarterly, annually
+    frequency: FrequencyType
     start_date: datetime
     end_date: Optional[datetime] = None
     day_of_month: Optional[int] = None  # 1-31 for monthly/quarterly
     day_of_week: Optional[int] = None   # 0-6 for weekly (0=Monday)
-    is_active: Optional[str] = "active"
+    is_active: ActiveState = ActiveState.ACTIVE
     supplier: Optional[str] = None
     reference: Optional[str] = None
     notes: Optional[str] = None
@@ -29,12 +30,12 @@ class RecurringExpenseUpdate(BaseModel):
     description: Optional[str] = None
     amount: Optional[Decimal] = None
     vat_amount: Optional[Decimal] = None
-    frequency: Optional[str] = None
+    frequency: Optional[FrequencyType] = None
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
     day_of_month: Optional[int] = None
     day_of_week: Optional[int] = None
-    is_active: Optional[str] = None
+    is_active: Optional[ActiveState] = None
     supplier: Optional[str] = None
     reference: Optional[str] = None
     notes: Optional[str] = None
@@ -2,18 +2,19 @@ from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from typing import Optional
 from decimal import Decimal
+from app.models.enums import ActiveState, FrequencyType
 
 class RecurringIncomeBase(BaseModel):
     name: str
     description: Optional[str] = None
     amount: Decimal
     vat_amount: Optional[Decimal] = Decimal('0.00')
-    frequency: str  # weekly, monthly, quarterly, annually
+    frequency: FrequencyType
     start_date: datetime
     end_date: Optional[datetime] = None
     day_of_month: Optional[int] = None  # 1-31 for monthly/quarterly
     day_of_week: Optional[int] = None   # 0-6 for weekly (0=Monday)
-    is_active: Optional[str] = "active"
+    is_active: ActiveState = ActiveState.ACTIVE
     notes: Optional[str] = None
     company_id: int
     customer_id: Optional[int] = None
@@ -27,12 +28,12 @@ class RecurringIncomeUpdate(BaseModel):
     description: Optional[str] = None
     amount: Optional[Decimal] = None
     vat_amount: Optional[Decimal] = None
-    frequency: Optional[str] = None
+    frequency: Optional[FrequencyType] = None
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
     day_of_month: Optional[int] = None
     day_of_week: Optional[int] = None
-    is_active: Optional[str] = None
+    is_active: Optional[ActiveState] = None
     notes: Optional[str] = None
     customer_id: Optional[int] = None
     bank_account_id: Optional[int] = None
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, TypeAdapter
+from typing import List, Optional
 from datetime import datetime, date
 from decimal import Decimal
 from app.models.transaction import TransactionType, TransactionStatus
@@ -41,4 +41,7 @@ class Transaction(TransactionBase):
     updated_at: Optional[datetime] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# Prebuilt adapter for list endpoints that render ORM rows straight to JSON
+TransactionList = TypeAdapter(List[Transaction])
@@ -0,0 +1,25 @@
+from threading import Lock
+from typing import Optional
+from cachetools import TTLCache
+from sqlalchemy.orm import Session
+from app.models.expense import ExpenseCategory
+
+# Category names are global (not scoped per company), so the name alone is the key.
+# Entries expire after a minute so other worker processes pick up changes too.
+_category_id_cache = TTLCache(maxsize=4096, ttl=60)
+_category_id_cache_lock = Lock()
+
+def get_category_id_by_name(db: Session, name: str) -> Optional[int]:
+    with _category_id_cache_lock:
+        if name in _category_id_cache:
+            return _category_id_cache[name]
+
+    category_id = db.query(ExpenseCategory.id).filter(ExpenseCategory.name == name).limit(1).scalar()
+
+    with _category_id_cache_lock:
+        _category_id_cache[name] = category_id
+    return category_id
+
+def invalidate_category_cache():
+    with _category_id_cache_lock:
+        _category_id_cache.clear()
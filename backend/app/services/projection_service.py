@@ -1,8 +1,12 @@
-from datetime import datetime, timedelta, date
-from dateutil.relativedelta import relativedelta
+from collections import defaultdict
+from itertools import chain
+from functools import lru_cache
+from calendar import monthrange
+from datetime import datetime, timedelta, date, time
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from typing import List, Dict, Optional
+from sqlalchemy import and_, or_, select
+from sqlalchemy.engine import Row
+from typing import List, Dict, Iterator, Optional, Tuple
 from decimal import Decimal
 
 from app.models.recurring_income import RecurringIncome
@@ -10,249 +14,291 @@ from app.models.recurring_expense import RecurringExpense
 from app.models.one_off_item import OneOffItem
 from app.models.cash_flow_projection import CashFlowProjection, ProjectionItem
 from app.models.bank_account import BankAccount
+from app.models.money import to_cents, from_cents
+from app.core.bulk import bulk_copy, bulk_txn
+
+_ONE_WEEK = timedelta(days=7)
+# Projection items are written as they are generated, this many rows at a time
+_ITEM_CHUNK_ROWS = 10_000
+_MIDNIGHT = time.min
+
+# Columns the projection reads from each recurring stream; selected as plain rows
+_STREAM_COLUMNS = ('id', 'company_id', 'name', 'vat_amount', 'frequency', 'start_date', 'end_date', 'day_of_month', 'day_of_week', 'bank_account_id')
+_ONE_OFF_COLUMNS = ('id', 'company_id', 'name', 'item_type', 'amount', 'vat_amount', 'planned_date', 'bank_account_id')
+
+@lru_cache(maxsize=None)
+def _days_in_month(year: int, month: int) -> int:
+    """Length of a month; monthrange also works out the weekday, which we never use"""
+    return monthrange(year, month)[1]
+
+def _add_months(current: date, months: int, day: int) -> date:
+    """Shift by whole months, clamping day to the target month's length"""
+    month_index = current.month - 1 + months
+    year = current.year + month_index // 12
+    month = month_index % 12 + 1
+    return date(year, month, min(day, _days_in_month(year, month)))
 
 class ProjectionCalculationService:
     def __init__(self, db: Session):
         self.db = db
+        # Occurrence dates per schedule key, shared by streams on the same schedule
+        self._schedule_cache: Dict[tuple, tuple] = {}
 
     def generate_projections(self, company_id: int, start_date: date, end_date: date, starting_balance: Optional[Decimal] = None):
         """Generate cash flow projections for a company over a date range with per-account tracking"""
         
-        # Clear existing projections for this date range
-        self.db.query(CashFlowProjection).filter(
-            and_(
-                CashFlowProjection.company_id == company_id,
-                CashFlowProjection.projection_date >= start_date,
-                CashFlowProjection.projection_date <= end_date
-            )
-        ).delete()
-        
-        self.db.query(ProjectionItem).filter(
-            and_(
-                ProjectionItem.company_id == company_id,
-                ProjectionItem.projection_date >= start_date,
-                ProjectionItem.projection_date <= end_date
-            )
-        ).delete()
+        # Stream bounds as datetimes so comparisons against the DateTime columns are by
+        # day on every backend (SQLite sorts a bare date before that day's timestamps)
+        range_start = datetime.combine(start_date, _MIDNIGHT)
+        range_end = datetime.combine(end_date + timedelta(days=1), _MIDNIGHT)
 
-        # Get all bank accounts for this company
-        bank_accounts = self.db.query(BankAccount).filter(
-            and_(
-                BankAccount.company_id == company_id,
-                BankAccount.is_active == True
-            )
-        ).all()
+        # Clear and regenerate the date range in one transaction
+        with bulk_txn(self.db):
+            # Clear existing projections for this date range
+            self.db.query(CashFlowProjection).filter(
+                and_(
+                    CashFlowProjection.company_id == company_id,
+                    CashFlowProjection.projection_date >= start_date,
+                    CashFlowProjection.projection_date <= end_date
+                )
+            ).delete(synchronize_session=False)
         
-        if not bank_accounts:
-            raise ValueError("No active bank accounts found for company. Please create at least one bank account.")
+            self.db.query(ProjectionItem).filter(
+                and_(
+                    ProjectionItem.company_id == company_id,
+                    ProjectionItem.projection_date >= start_date,
+                    ProjectionItem.projection_date <= end_date
+                )
+            ).delete(synchronize_session=False)
 
-        # Get all active recurring income and expenses
-        recurring_incomes = self.db.query(RecurringIncome).filter(
-            and_(
-                RecurringIncome.company_id == company_id,
-                RecurringIncome.is_active == "active"
-            )
-        ).all()
+            # Get all bank accounts for this company
+            bank_accounts = self.db.query(BankAccount).filter(
+                and_(
+                    BankAccount.company_id == company_id,
+                    BankAccount.is_active == True
+                )
+            ).all()
+        
+            if not bank_accounts:
+                raise ValueError("No active bank accounts found for company. Please create at least one bank account.")
 
-        recurring_expenses = self.db.query(RecurringExpense).filter(
-            and_(
-                RecurringExpense.company_id == company_id,
-                RecurringExpense.is_active == "active"
-            )
-        ).all()
+            # Only streams whose window overlaps the range
+            # Get all active recurring income and expenses as column rows (no ORM identity map)
+            recurring_incomes = self.db.execute(
+                select(*(getattr(RecurringIncome, column) for column in _STREAM_COLUMNS), RecurringIncome.amount_cents).where(
+                    and_(
+                        RecurringIncome.company_id == company_id,
+                        RecurringIncome.is_active == "active",
+                        RecurringIncome.start_date < range_end,
+                        or_(RecurringIncome.end_date.is_(None), RecurringIncome.end_date >= range_start)
+                    )
+                )
+            ).all()
 
-        # Get all one-off items in the date range (planned and confirmed items)
-        one_off_items = self.db.query(OneOffItem).filter(
-            and_(
-                OneOffItem.company_id == company_id,
-                OneOffItem.planned_date >= start_date,
-                OneOffItem.planned_date <= end_date,
-                OneOffItem.is_confirmed.in_(["planned", "confirmed"])
-            )
-        ).all()
+            recurring_expenses = self.db.execute(
+                select(*(getattr(RecurringExpense, column) for column in _STREAM_COLUMNS), RecurringExpense.amount).where(
+                    and_(
+                        RecurringExpense.company_id == company_id,
+                        RecurringExpense.is_active == "active",
+                        RecurringExpense.start_date < range_end,
+                        or_(RecurringExpense.end_date.is_(None), RecurringExpense.end_date >= range_start)
+                    )
+                )
+            ).all()
 
-        # Generate all projection items with bank account assignments
-        all_items = []
-        
-        # Process recurring income
-        for income in recurring_incomes:
-            items = self._generate_income_items(income, start_date, end_date)
-            all_items.extend(items)
-        
-        # Process recurring expenses
-        for expense in recurring_expenses:
-            items = self._generate_expense_items(expense, start_date, end_date)
-            all_items.extend(items)
-        
-        # Process one-off items
-        for one_off in one_off_items:
-            item = self._generate_one_off_item(one_off)
-            all_items.append(item)
+            # Get all one-off items in the date range (planned and confirmed items)
+            one_off_items = self.db.execute(
+                select(*(getattr(OneOffItem, column) for column in _ONE_OFF_COLUMNS)).where(
+                    and_(
+                        OneOffItem.company_id == company_id,
+                        OneOffItem.planned_date >= start_date,
+                        OneOffItem.planned_date <= end_date,
+                        OneOffItem.is_confirmed.in_(["planned", "confirmed"])
+                    )
+                )
+            ).all()
 
-        # Sort by date
-        all_items.sort(key=lambda x: x.projection_date)
+            # Initialize account balances; all daily arithmetic runs on integer cents
+            account_balances = {}
+            for account in bank_accounts:
+                account_balances[account.id] = to_cents(account.current_balance)
+            total_balance = sum(account_balances.values())
 
-        # Initialize account balances
-        account_balances = {}
-        for account in bank_accounts:
-            account_balances[account.id] = account.current_balance
+            # Every source as (item template, amount in cents, occurrence dates): recurring
+            # income, recurring expenses, then each one-off as a single-date stream
+            streams = chain(
+                (self._income_stream(income, start_date, end_date) for income in recurring_incomes),
+                (self._expense_stream(expense, start_date, end_date) for expense in recurring_expenses),
+                self._one_off_streams(one_off_items),
+            )
 
-        # Generate per-account projections and consolidated view
-        current_date = start_date
-        while current_date <= end_date:
-            # Calculate per-account flows for this date
-            account_flows = {account.id: {'income': Decimal('0.00'), 'expense': Decimal('0.00')} for account in bank_accounts}
-            
-            # Sum up all items for this date by account
-            for item in all_items:
-                item_date = item.projection_date.date() if hasattr(item.projection_date, 'date') else item.projection_date
-                if item_date == current_date:
-                    account_id = item.bank_account_id
-                    if account_id and account_id in account_flows:
-                        if item.item_type == "income":
-                            account_flows[account_id]['income'] += item.amount
-                        else:
-                            account_flows[account_id]['expense'] += item.amount
+            # Bucket amounts by (date, account) as items are generated: [income, expense],
+            # writing the items out in chunks so the full list is never held in memory
+            flows = defaultdict(lambda: [0, 0])
+            item_chunk = []
+            for template, amount_cents, occurrences in streams:
+                account_id = template['bank_account_id']
+                tracked = bool(account_id) and account_id in account_balances
+                slot = 0 if template['item_type'] == "income" else 1
+                for occurrence in occurrences:
+                    if tracked:
+                        flows[(occurrence, account_id)][slot] += amount_cents
+                    item_chunk.append({**template, 'projection_date': occurrence})
+                    if len(item_chunk) == _ITEM_CHUNK_ROWS:
+                        bulk_copy(self.db, ProjectionItem, item_chunk)
+                        item_chunk = []
+            bulk_copy(self.db, ProjectionItem, item_chunk)
+            no_flow = (0, 0)
 
-            # Create per-account projections
-            total_income = Decimal('0.00')
-            total_expense = Decimal('0.00')
-            
-            for account in bank_accounts:
-                account_id = account.id
-                daily_income = account_flows[account_id]['income']
-                daily_expense = account_flows[account_id]['expense']
-                net_flow = daily_income - daily_expense
+            # Generate per-account projections and consolidated view
+            projections = []
+            current_date = start_date
+            while current_date <= end_date:
+                # Create per-account projections
+                total_income = 0
+                total_expense = 0
+                for account in bank_accounts:
+                    account_id = account.id
+                    daily_income, daily_expense = flows.get((current_date, account_id), no_flow)
+                    net_flow = daily_income - daily_expense
                 
-                # Update account balance
-                account_balances[account_id] += net_flow
+                    # Update account balance
+                    account_balances[account_id] += net_flow
                 
-                # Create per-account projection for every day to show complete balance history
-                projection = CashFlowProjection(
-                    company_id=company_id,
-                    bank_account_id=account_id,
-                    projection_date=datetime.combine(current_date, datetime.min.time()),
-                    income_amount=daily_income,
-                    expense_amount=daily_expense,
-                    net_flow=net_flow,
-                    running_balance=account_balances[account_id]
-                )
-                self.db.add(projection)
+                    # Create per-account projection for every day to show complete balance history
+                    projections.append({
+                        'company_id': company_id,
+                        'bank_account_id': account_id,
+                        'projection_date': current_date,
+                        'income_amount': from_cents(daily_income),
+                        'expense_amount': from_cents(daily_expense),
+                        'net_flow': from_cents(net_flow),
+                        'running_balance': from_cents(account_balances[account_id])
+                    })
                 
-                # Add to totals for consolidated view
-                total_income += daily_income
-                total_expense += daily_expense
+                    # Add to totals for consolidated view
+                    total_income += daily_income
+                    total_expense += daily_expense
 
-            # Create consolidated company-wide projection
-            total_net_flow = total_income - total_expense
-            total_balance = sum(account_balances.values())
+                # Create consolidated company-wide projection
+                total_net_flow = total_income - total_expense
+                total_balance += total_net_flow
             
-            consolidated_projection = CashFlowProjection(
-                company_id=company_id,
-                bank_account_id=None,  # NULL for consolidated view
-                projection_date=datetime.combine(current_date, datetime.min.time()),
-                income_amount=total_income,
-                expense_amount=total_expense,
-                net_flow=total_net_flow,
-                running_balance=total_balance
-            )
-            self.db.add(consolidated_projection)
+                projections.append({
+                    'company_id': company_id,
+                    'bank_account_id': None,  # NULL for consolidated view
+                    'projection_date': current_date,
+                    'income_amount': from_cents(total_income),
+                    'expense_amount': from_cents(total_expense),
+                    'net_flow': from_cents(total_net_flow),
+                    'running_balance': from_cents(total_balance)
+                })
             
-            current_date += timedelta(days=1)
+                current_date += timedelta(days=1)
 
-        # Bulk insert all projection items
-        for item in all_items:
-            self.db.add(item)
+            # Bulk load all projections (COPY on Postgres)
+            bulk_copy(self.db, CashFlowProjection, projections)
 
-        self.db.commit()
-
-    def _generate_income_items(self, income: RecurringIncome, start_date: date, end_date: date) -> List[ProjectionItem]:
-        """Generate projection items for a recurring income"""
-        items = []
-        
+    def _income_stream(self, income: Row, start_date: date, end_date: date) -> Tuple[dict, int, tuple]:
+        """Item template, amount in cents and occurrence dates for a recurring income"""
         # Find the first occurrence on or after the start_date
         income_start = income.start_date.date() if hasattr(income.start_date, 'date') else income.start_date
         income_end = income.end_date.date() if income.end_date and hasattr(income.end_date, 'date') else income.end_date
         current_date = max(start_date, income_start)
         end_limit = min(end_date, income_end if income_end else end_date)
 
-        # Check if there's an occurrence in the current month/period that we should include
-        first_occurrence = self._find_first_occurrence(current_date, income.frequency, income.day_of_month, income.day_of_week)
+        # Everything but the date is fixed per stream, so build it once
+        template = {
+            'company_id': income.company_id,
+            'item_name': income.name,
+            'item_type': "income",
+            'amount': from_cents(income.amount_cents),
+            'vat_amount': income.vat_amount or Decimal('0.00'),
+            'source_type': "recurring_income",
+            'source_id': income.id,
+            'bank_account_id': income.bank_account_id
+        }
         
-        while first_occurrence <= end_limit:
-            if first_occurrence >= current_date:  # Only include if on or after start date
-                item = ProjectionItem(
-                    company_id=income.company_id,
-                    projection_date=datetime.combine(first_occurrence, datetime.min.time()),
-                    item_name=income.name,
-                    item_type="income",
-                    amount=income.amount,
-                    vat_amount=income.vat_amount or Decimal('0.00'),
-                    source_type="recurring_income",
-                    source_id=income.id,
-                    bank_account_id=income.bank_account_id
-                )
-                items.append(item)
-            
-            # Move to next occurrence
-            first_occurrence = self._calculate_next_occurrence(first_occurrence, income.frequency, income.day_of_month, income.day_of_week)
+        occurrences = self._schedule(current_date, end_limit, income.frequency, income.day_of_month, income.day_of_week)
+        return template, income.amount_cents, occurrences
 
-        return items
-
-    def _generate_expense_items(self, expense: RecurringExpense, start_date: date, end_date: date) -> List[ProjectionItem]:
-        """Generate projection items for a recurring expense"""
-        items = []
-        
+    def _expense_stream(self, expense: Row, start_date: date, end_date: date) -> Tuple[dict, int, tuple]:
+        """Item template, amount in cents and occurrence dates for a recurring expense"""
         # Find the first occurrence on or after the start_date
         expense_start = expense.start_date.date() if hasattr(expense.start_date, 'date') else expense.start_date
         expense_end = expense.end_date.date() if expense.end_date and hasattr(expense.end_date, 'date') else expense.end_date
         current_date = max(start_date, expense_start)
         end_limit = min(end_date, expense_end if expense_end else end_date)
 
-        # Check if there's an occurrence in the current month/period that we should include
-        first_occurrence = self._find_first_occurrence(current_date, expense.frequency, expense.day_of_month, expense.day_of_week)
+        # Everything but the date is fixed per stream, so build it once
+        template = {
+            'company_id': expense.company_id,
+            'item_name': expense.name,
+            'item_type': "expense",
+            'amount': expense.amount,
+            'vat_amount': expense.vat_amount or Decimal('0.00'),
+            'source_type': "recurring_expense",
+            'source_id': expense.id,
+            'bank_account_id': expense.bank_account_id
+        }
         
-        while first_occurrence <= end_limit:
-            if first_occurrence >= current_date:  # Only include if on or after start date
-                item = ProjectionItem(
-                    company_id=expense.company_id,
-                    projection_date=datetime.combine(first_occurrence, datetime.min.time()),
-                    item_name=expense.name,
-                    item_type="expense",
-                    amount=expense.amount,
-                    vat_amount=expense.vat_amount or Decimal('0.00'),
-                    source_type="recurring_expense",
-                    source_id=expense.id,
-                    bank_account_id=expense.bank_account_id
-                )
-                items.append(item)
-            
-            # Move to next occurrence
-            first_occurrence = self._calculate_next_occurrence(first_occurrence, expense.frequency, expense.day_of_month, expense.day_of_week)
+        occurrences = self._schedule(current_date, end_limit, expense.frequency, expense.day_of_month, expense.day_of_week)
+        return template, to_cents(expense.amount), occurrences
 
-        return items
+    def _schedule(self, current_date: date, end_limit: date, frequency: str, day_of_month: Optional[int], day_of_week: Optional[int]) -> tuple:
+        """Occurrence dates on or after current_date through end_limit, memoized per schedule"""
+        key = (current_date, end_limit, frequency, day_of_month, day_of_week)
+        occurrences = self._schedule_cache.get(key)
+        if occurrences is None:
+            # Check if there's an occurrence in the current month/period that we should include
+            first_occurrence = self._find_first_occurrence(current_date, frequency, day_of_month, day_of_week)
+            occurrences = tuple(
+                occurrence
+                for occurrence in self._occurrence_dates(first_occurrence, end_limit, frequency, day_of_month, day_of_week)
+                if occurrence >= current_date  # Only include if on or after start date
+            )
+            self._schedule_cache[key] = occurrences
+        return occurrences
+
+    def _occurrence_dates(self, first_occurrence: date, end_limit: date, frequency: str, day_of_month: Optional[int], day_of_week: Optional[int]) -> List[date]:
+        """List every occurrence from first_occurrence through end_limit"""
+        if first_occurrence > end_limit:
+            return []
+
+        # Fixed-step schedules are closed-form: the k-th date depends only on k
+        if frequency == "weekly" and day_of_week is not None:
+            count = (end_limit - first_occurrence).days // 7 + 1
+            return [first_occurrence + timedelta(days=7 * k) for k in range(count)]
+        if frequency in ("monthly", "quarterly") and day_of_month:
+            step = 1 if frequency == "monthly" else 3
+            months = (end_limit.year - first_occurrence.year) * 12 + end_limit.month - first_occurrence.month
+            dates = [_add_months(first_occurrence, k * step, day_of_month) for k in range(months // step + 1)]
+            return [occurrence for occurrence in dates if occurrence <= end_limit]
+        if frequency == "annually":
+            # A Feb 29 start settles on Feb 28 after the first year and stays there
+            day = min(first_occurrence.day, 28) if first_occurrence.month == 2 else first_occurrence.day
+            dates = [first_occurrence] + [_add_months(first_occurrence, 12 * k, day) for k in range(1, end_limit.year - first_occurrence.year + 1)]
+            return [occurrence for occurrence in dates if occurrence <= end_limit]
+
+        # Without an anchor day each step depends on the previous date (e.g. Jan 31 -> Feb 29 -> Mar 29)
+        dates = []
+        occurrence = first_occurrence
+        while occurrence <= end_limit:
+            dates.append(occurrence)
+            occurrence = self._calculate_next_occurrence(occurrence, frequency, day_of_month, day_of_week)
+        return dates
 
     def _find_first_occurrence(self, start_date: date, frequency: str, day_of_month: Optional[int], day_of_week: Optional[int]) -> date:
         """Find the first occurrence on or after start_date"""
-        if frequency == "monthly":
+        if frequency in ("monthly", "quarterly"):
             if day_of_month:
-                # Check if the day has already passed this month
-                try:
-                    current_month_date = start_date.replace(day=day_of_month)
-                    if current_month_date >= start_date:
-                        return current_month_date
-                except ValueError:
-                    # Day doesn't exist in this month, use last day of month
-                    current_month_date = start_date.replace(day=28)
-                    if current_month_date >= start_date:
-                        return current_month_date
+                # Day doesn't exist in this month, use last day of month
+                current_period_date = start_date.replace(day=min(day_of_month, _days_in_month(start_date.year, start_date.month)))
+                if current_period_date >= start_date:
+                    return current_period_date
                 
-                # If we've passed the day this month, go to next month
-                next_month = start_date.replace(day=1) + relativedelta(months=1)
-                try:
-                    return next_month.replace(day=day_of_month)
-                except ValueError:
-                    return next_month.replace(day=28)
+                # If we've passed the day this period, go to the next one
+                return _add_months(start_date, 1 if frequency == "monthly" else 3, day_of_month)
             else:
                 return start_date
         
@@ -263,37 +309,14 @@ class ProjectionCalculationService:
             else:
                 return start_date
         
-        elif frequency == "quarterly":
-            if day_of_month:
-                # Similar logic to monthly but for quarters
-                try:
-                    current_period_date = start_date.replace(day=day_of_month)
-                    if current_period_date >= start_date:
-                        return current_period_date
-                except ValueError:
-                    current_period_date = start_date.replace(day=28)
-                    if current_period_date >= start_date:
-                        return current_period_date
-                
-                # Move to next quarter
-                next_quarter = start_date.replace(day=1) + relativedelta(months=3)
-                try:
-                    return next_quarter.replace(day=day_of_month)
-                except ValueError:
-                    return next_quarter.replace(day=28)
-            else:
-                return start_date
-        
         elif frequency == "annually":
-            try:
-                current_year_date = start_date.replace(month=start_date.month, day=day_of_month if day_of_month else start_date.day)
-                if current_year_date >= start_date:
-                    return current_year_date
-            except ValueError:
-                pass
+            day = day_of_month if day_of_month else start_date.day
+            current_year_date = start_date.replace(day=min(day, _days_in_month(start_date.year, start_date.month)))
+            if current_year_date >= start_date:
+                return current_year_date
             
             # Move to next year
-            return start_date + relativedelta(years=1)
+            return _add_months(start_date, 12, start_date.day)
         
         # Default fallback
         return start_date
@@ -304,57 +327,39 @@ class ProjectionCalculationService:
         if frequency == "weekly":
             # Calculate next occurrence of the specified day of week
             days_ahead = (day_of_week - current_date.weekday()) % 7
-            if days_ahead == 0 and current_date == current_date:  # If it's the same day, move to next week
-                days_ahead = 7
+            if days_ahead == 0:  # If it's the same day, move to next week
+                return current_date + _ONE_WEEK
             return current_date + timedelta(days=days_ahead)
             
         elif frequency == "monthly":
-            # Next month, same day
-            if day_of_month:
-                next_month = current_date.replace(day=1) + relativedelta(months=1)
-                try:
-                    return next_month.replace(day=min(day_of_month, 28))  # Avoid invalid dates
-                except ValueError:
-                    return next_month.replace(day=28)  # Fallback for invalid dates
-            else:
-                return current_date + relativedelta(months=1)
+            # Next month, same day (clamped to the month's length)
+            return _add_months(current_date, 1, day_of_month or current_date.day)
                 
         elif frequency == "quarterly":
-            # Next quarter, same day
-            if day_of_month:
-                next_quarter = current_date.replace(day=1) + relativedelta(months=3)
-                try:
-                    return next_quarter.replace(day=min(day_of_month, 28))
-                except ValueError:
-                    return next_quarter.replace(day=28)
-            else:
-                return current_date + relativedelta(months=3)
+            # Next quarter, same day (clamped to the month's length)
+            return _add_months(current_date, 3, day_of_month or current_date.day)
                 
         elif frequency == "annually":
-            # Next year, same date
-            try:
-                return current_date + relativedelta(years=1)
-            except ValueError:
-                # Handle leap year edge case
-                return current_date.replace(month=2, day=28) + relativedelta(years=1)
+            # Next year, same date (Feb 29 falls back to Feb 28)
+            return _add_months(current_date, 12, current_date.day)
         
         # Default fallback
         return current_date + timedelta(days=30)
 
-    def _generate_one_off_item(self, one_off: OneOffItem) -> ProjectionItem:
-        """Generate a projection item from a one-off item"""
-        item = ProjectionItem(
-            company_id=one_off.company_id,
-            projection_date=one_off.planned_date,
-            item_name=one_off.name,
-            item_type=one_off.item_type,
-            amount=one_off.amount,
-            vat_amount=one_off.vat_amount or Decimal('0.00'),
-            source_type="one_off_item",
-            source_id=one_off.id,
-            bank_account_id=one_off.bank_account_id
-        )
-        return item
+    def _one_off_streams(self, one_offs: List[Row]) -> Iterator[Tuple[dict, int, tuple]]:
+        """Item template, amount in cents and its single planned date for each one-off item"""
+        for one_off in one_offs:
+            template = {
+                'company_id': one_off.company_id,
+                'item_name': one_off.name,
+                'item_type': one_off.item_type,
+                'amount': one_off.amount,
+                'vat_amount': one_off.vat_amount or Decimal('0.00'),
+                'source_type': "one_off_item",
+                'source_id': one_off.id,
+                'bank_account_id': one_off.bank_account_id
+            }
+            yield template, to_cents(one_off.amount), (one_off.planned_date.date(),)
 
     def get_projections(self, company_id: int, start_date: date, end_date: date, bank_account_id: Optional[int] = None) -> List[CashFlowProjection]:
         """Get cash flow projections for a date range, optionally filtered by bank account"""
@@ -379,7 +384,7 @@ class ProjectionCalculationService:
         query = self.db.query(ProjectionItem).filter(
             and_(
                 ProjectionItem.company_id == company_id,
-                ProjectionItem.projection_date == datetime.combine(projection_date, datetime.min.time())
+                ProjectionItem.projection_date == projection_date
             )
         )
         
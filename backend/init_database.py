@@ -7,7 +7,7 @@ import os
 import sys
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from app.core.config import settings
 from app.core.database import Base
 from app.models import user, company, customer, transaction, recurring_income, recurring_expense, one_off_item, bank_account, cash_flow_projection
@@ -26,8 +26,13 @@ def init_database():
             print(f"Creating database tables with: {database_url.split('@')[1] if '@' in database_url else 'SQLite'}")
         
         engine = create_engine(database_url)
-        Base.metadata.create_all(bind=engine)
-        print("Database tables created successfully!")
+        if inspect(engine).has_table('users'):
+            # Existing database: schema changes are applied by `alembic upgrade head`
+            print("Database tables already exist, skipping create_all")
+        else:
+            # Known-empty database, so skip the per-table existence checks
+            Base.metadata.create_all(bind=engine, checkfirst=False)
+            print("Database tables created successfully!")
         
         if 'sqlite' in database_url.lower():
             print("Database file: app.db")
@@ -55,6 +55,17 @@ api.interceptors.response.use(
   }
 )
 
+// Fetch a CSV file response and return its contents with the server-provided filename
+const downloadCSV = async (url: string): Promise<{ filename: string; content: string }> => {
+  const response = await api.get(url, { responseType: 'text' })
+  const disposition: string = response.headers['content-disposition'] || ''
+  const match = disposition.match(/filename="?([^";]+)"?/)
+  return {
+    filename: match ? match[1] : 'export.csv',
+    content: response.data
+  }
+}
+
 export const authApi = {
   login: async (credentials: LoginCredentials): Promise<Token> => {
     const formData = new FormData()
@@ -291,9 +302,8 @@ export const recurringIncomeApi = {
     return response.data
   },
 
-  exportCSV: async (companyId: number): Promise<{ filename: string; content: string; count: number }> => {
-    const response = await api.get(`/api/v1/recurring-income/company/${companyId}/export-csv`)
-    return response.data
+  exportCSV: async (companyId: number): Promise<{ filename: string; content: string }> => {
+    return downloadCSV(`/api/v1/recurring-income/company/${companyId}/export-csv`)
   },
 }
 
@@ -322,9 +332,8 @@ export const recurringExpenseApi = {
     await api.delete(`/api/v1/recurring-expenses/${id}`)
   },
 
-  downloadTemplate: async (): Promise<{ filename: string; content: string; instructions: any }> => {
-    const response = await api.get('/api/v1/recurring-expenses/import-template')
-    return response.data
+  downloadTemplate: async (): Promise<{ filename: string; content: string }> => {
+    return downloadCSV('/api/v1/recurring-expenses/import-template')
   },
 
   importCSV: async (companyId: number, file: File): Promise<{ success: number; imported_items: string[]; errors: string[]; total_processed: number }> => {
@@ -339,9 +348,8 @@ export const recurringExpenseApi = {
     return response.data
   },
 
-  exportCSV: async (companyId: number): Promise<{ filename: string; content: string; count: number }> => {
-    const response = await api.get(`/api/v1/recurring-expenses/company/${companyId}/export-csv`)
-    return response.data
+  exportCSV: async (companyId: number): Promise<{ filename: string; content: string }> => {
+    return downloadCSV(`/api/v1/recurring-expenses/company/${companyId}/export-csv`)
   },
 }
 
@@ -80,7 +80,7 @@ CREATE TABLE recurring_income (
     id SERIAL PRIMARY KEY,
     name VARCHAR NOT NULL,
     description TEXT,
-    amount DECIMAL(15, 2) NOT NULL,
+    amount_cents BIGINT NOT NULL,
     vat_amount DECIMAL(15, 2) DEFAULT 0.0,
     frequency VARCHAR NOT NULL CHECK (frequency IN ('weekly', 'monthly', 'quarterly', 'annually')),
     start_date DATE NOT NULL,
@@ -116,7 +116,8 @@ CREATE TABLE recurring_expenses (
     category_id INTEGER REFERENCES expense_categories(id) ON DELETE SET NULL,
     bank_account_id INTEGER REFERENCES bank_accounts(id) ON DELETE SET NULL,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    version INTEGER NOT NULL DEFAULT 1
 );
 
 -- One-off items table
@@ -171,7 +172,7 @@ CREATE TABLE projection_items (
 CREATE TABLE transactions (
     id SERIAL PRIMARY KEY,
     description VARCHAR NOT NULL,
-    amount DECIMAL(15, 2) NOT NULL,
+    amount_cents BIGINT NOT NULL,
     transaction_date DATE NOT NULL,
     transaction_type VARCHAR NOT NULL CHECK (transaction_type IN ('income', 'expense')),
     category VARCHAR,